@@ -8,18 +8,26 @@ https://github.com/gazoodle/gecko-home-assistant
 import logging
 import uuid
 
+from geckolib import VERSION as GECKOLIB_VERSION
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.loader import async_get_integration
 
+from .catalog import GeckoEntityCatalog
 from .const import (
     CONF_CLIENT_ID,
     CONF_SPA_ADDRESS,
     CONF_SPA_IDENTIFIER,
     CONF_SPA_NAME,
     DOMAIN,
+    SENSOR,
     STARTUP_MESSAGE,
+    TRACE_KEY,
 )
-from .spa_manager import GeckoSpaManager
+from .discovery import async_close_discovery_service, async_get_discovery_service
+from .spa_manager import GeckoSpaManager, take_over
+from .tracer import GeckoTracer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,16 +43,39 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         config_entry.version = 2
         hass.config_entries.async_update_entry(config_entry, data=new)
 
+    if config_entry.version == 2:  # noqa: PLR2004
+        # The last ping sensor was replaced by the ping statistics sensor, so
+        # remove it rather than leave it orphaned in the registry
+        registry = er.async_get(hass)
+        for entity in er.async_entries_for_config_entry(
+            registry, config_entry.entry_id
+        ):
+            if entity.domain == SENSOR and entity.unique_id.endswith("-PING"):
+                registry.async_remove(entity.entity_id)
+
+        hass.config_entries.async_update_entry(config_entry, version=3)
+
     _LOGGER.debug("Migration to version %s successful", config_entry.version)
 
     return True
 
 
+async def async_startup_message(hass: HomeAssistant) -> str:
+    """Build the startup message from the manifest Home Assistant has loaded."""
+    integration = await async_get_integration(hass, DOMAIN)
+    return STARTUP_MESSAGE.format(
+        name=integration.name,
+        version=integration.version,
+        geckolib_version=GECKOLIB_VERSION,
+        issue_url=integration.manifest.get("issue_tracker"),
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
-        _LOGGER.info(STARTUP_MESSAGE)
+        _LOGGER.info(await async_startup_message(hass))
 
     spa_identifier = None
     spa_address = None
@@ -65,15 +96,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         spa_name,
     )
 
-    spaman = GeckoSpaManager(
-        client_id,
-        hass,
-        entry,
-        spa_identifier=spa_identifier,
-        spa_address=spa_address,
-        spa_name=spa_name,
-    )
-    await spaman.__aenter__()
+    tracer = GeckoTracer(entry.title, enabled=entry.options.get(TRACE_KEY, False))
+    with tracer.span("async_setup_entry"):
+        spaman = take_over(hass, client_id)
+        if spaman is not None:
+            _LOGGER.debug("Take over the manager connected by the config flow")
+            with tracer.span("attach"):
+                await spaman.async_attach(entry, tracer)
+        else:
+            with tracer.span("discovery service"):
+                discovery = await async_get_discovery_service(hass)
+            spaman = GeckoSpaManager(
+                client_id,
+                hass,
+                entry,
+                discovery,
+                tracer,
+                spa_identifier=spa_identifier,
+                spa_address=spa_address,
+                spa_name=spa_name,
+            )
+            with tracer.span("load catalog"):
+                await spaman.async_load_catalog()
+            with tracer.span("start spa manager"):
+                await spaman.__aenter__()
 
     hass.data[DOMAIN][entry.entry_id] = spaman
 
@@ -84,15 +130,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+    await spaman.async_save_catalog()
+    if spaman.tracer.enabled:
+        await spaman.async_export_trace()
     unloaded = await spaman.unload_platforms()
     if unloaded:
         _LOGGER.debug("Close SpaMan")
         await spaman.async_reset()
         await spaman.__aexit__()
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            await async_close_discovery_service(hass)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle removal of an entry's persistent data."""
+    await GeckoEntityCatalog(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import BINARY_SENSOR, DOMAIN
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 
 if TYPE_CHECKING:
     from .spa_manager import GeckoSpaManager
@@ -23,17 +23,23 @@ async def async_setup_entry(
     """Set up binary_sensor platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
     _LOGGER.debug("Load binary sensor platform")
-    if spaman.facade is not None:
-        async_add_entities(
-            [
-                GeckoBinarySensor(spaman, entry, sensor)
-                for sensor in spaman.facade.binary_sensors
-            ]
-        )
-        async_add_entities(
-            [GeckoBinarySensor(spaman, entry, spaman.facade.spa_in_use_sensor)]
-        )
-    spaman.platform_loaded(BINARY_SENSOR)
+    await spaman.async_setup_platform(
+        BINARY_SENSOR, async_add_entities, _build_entities
+    )
+
+
+def _build_entities(
+    spaman: "GeckoSpaManager", entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the binary sensor entities for the spa."""
+    if not spaman.can_use_facade or spaman.facade is None:
+        return []
+    sensors: list = [
+        GeckoBinarySensor(spaman, entry, sensor)
+        for sensor in spaman.facade.binary_sensors
+    ]
+    sensors.append(GeckoBinarySensor(spaman, entry, spaman.facade.spa_in_use_sensor))
+    return sensors
 
 
 class GeckoBinarySensor(GeckoEntity, BinarySensorEntity):
@@ -2,19 +2,24 @@
 
 import datetime
 import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from geckolib.automation.button import GeckoButton as GeckoLibButton
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.loader import async_get_integration
 
-from .const import BUTTON, DOMAIN
-from .const import VERSION as INTEGRATION_VERSION
+from .const import BUTTON, DOMAIN, SNAPSHOT_DIRECTORY, SNAPSHOT_RETENTION
 from .entity import GeckoEntity, GeckoEntityBase
+from .snapshot import write_snapshot
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib.automation.button import GeckoButton as GeckoLibButton
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -23,7 +28,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    buttons = []
+    await spaman.async_setup_platform(BUTTON, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the button entities for the spa."""
+    buttons: list = []
     if spaman.can_use_facade:
         buttons.append(GeckoSnapshotButton(entry, spaman))
         buttons.extend(
@@ -34,8 +46,7 @@ async def async_setup_entry(
         )
     if spaman.reconnect_button is not None:
         buttons.append(GeckoReconnectButton(entry, spaman))
-    async_add_entities(buttons)
-    spaman.platform_loaded(BUTTON)
+    return buttons
 
 
 class GeckoButton(GeckoEntity, ButtonEntity):
@@ -46,7 +57,10 @@ class GeckoKeypadButton(GeckoButton):
     """Gecko keypad button."""
 
     def __init__(
-        self, config_entry: ConfigEntry, spaman: GeckoSpaManager, button: GeckoLibButton
+        self,
+        config_entry: ConfigEntry,
+        spaman: GeckoSpaManager,
+        button: "GeckoLibButton",
     ) -> None:
         """Initialize the keypad button."""
         super().__init__(spaman, config_entry, button)
@@ -60,6 +74,8 @@ class GeckoKeypadButton(GeckoButton):
 class GeckoReconnectButton(GeckoButton):
     """Gecko Reconnect button class."""
 
+    _attr_icon = "mdi:connection"
+
     def __init__(self, config_entry: ConfigEntry, spaman: GeckoSpaManager) -> None:
         """Initialize the button class."""
         super().__init__(
@@ -70,15 +86,12 @@ class GeckoReconnectButton(GeckoButton):
         """Press the button asynchronously."""
         await self._automation_entity.async_press()
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for this."""
-        return "mdi:connection"
-
 
 class GeckoSnapshotButton(GeckoEntityBase, ButtonEntity):
     """Gecko Snapshot button class."""
 
+    _attr_icon = "mdi:magnify-scan"
+
     def __init__(self, config_entry: ConfigEntry, spaman: GeckoSpaManager) -> None:
         """Initialize the button class."""
         super().__init__(
@@ -88,38 +101,40 @@ class GeckoSnapshotButton(GeckoEntityBase, ButtonEntity):
             "Snapshot",
             spaman.facade.name,
         )
-        self._entity_category = EntityCategory.DIAGNOSTIC
+        self._source = spaman.facade
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     async def async_press(self) -> None:
         """Press the button asynchronously."""
         facade = self.spaman.facade
         if facade is None:
             return
+        taken_at = datetime.datetime.now().astimezone()
         data = facade.spa.get_snapshot_data()
+        integration = await async_get_integration(self.hass, DOMAIN)
         data.update(
             {
-                "Integration Version": INTEGRATION_VERSION,
+                "Integration Version": str(integration.version),
             }
         )
-        dump = f"SNAPSHOT ========{data}========"
-        _LOGGER.info(dump)
+        path = await self.hass.async_add_executor_job(
+            write_snapshot,
+            Path(self.hass.config.path(DOMAIN, SNAPSHOT_DIRECTORY)),
+            self.spaman.spa_name,
+            taken_at,
+            data,
+            SNAPSHOT_RETENTION,
+        )
+        _LOGGER.info("Snapshot saved to %s", path)
 
         persistent_body = (
-            f"A snapshot of your Gecko system was taken at {datetime.datetime.now().astimezone().isoformat()}\n"  # noqa: E501
-            f"<details>"
-            f"<summary>Click to expand</summary>\n\n"
-            f"```{data}```"
-            f"</details>"
+            f"A snapshot of your Gecko system was taken at {taken_at.isoformat()} "
+            f"and saved to `{path}`"
         )
 
-        # Make a persistent notification so it's easy to access
+        # Make a persistent notification so it's easy to find
         await self.hass.services.async_call(
             "notify",
             "persistent_notification",
             service_data={"message": persistent_body, "title": "Gecko Snapshot"},
         )
-
-    @property
-    def icon(self) -> str:
-        """Get the icon for this."""
-        return "mdi:magnify-scan"
@@ -0,0 +1,71 @@
+"""GeckoEntityCatalog class persists the last known entities of a spa."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import CATALOG_SAVE_DELAY, CATALOG_VERSION, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant
+
+    from .entity import GeckoEntityBase
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeckoEntityCatalog:
+    """
+    The entities a spa had the last time its facade was ready.
+
+    This lets every platform be loaded with unavailable entities straight
+    away at startup, rather than waiting for the spa to connect.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the catalog."""
+        self._store: Store = Store(hass, CATALOG_VERSION, f"{DOMAIN}.{entry_id}")
+        self.platforms: dict[str, dict[str, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the catalog from storage."""
+        data = await self._store.async_load()
+        if data is not None:
+            self.platforms = data.get("platforms", {})
+        _LOGGER.debug(
+            "Loaded catalog with %d entities",
+            sum(len(records) for records in self.platforms.values()),
+        )
+
+    def update(self, entities: Mapping[str, Mapping[str, GeckoEntityBase]]) -> None:
+        """Replace the catalog with the entities that are currently loaded."""
+        self.platforms = {
+            platform: {
+                unique_id: entity.catalog_record()
+                for unique_id, entity in platform_entities.items()
+            }
+            for platform, platform_entities in entities.items()
+            if platform_entities
+        }
+
+    def async_delay_save(self, data_func: Any) -> None:
+        """Save the catalog after a delay, coalescing frequent updates."""
+        self._store.async_delay_save(data_func, CATALOG_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the catalog now."""
+        await self._store.async_save(self.data)
+
+    async def async_remove(self) -> None:
+        """Remove the catalog from storage."""
+        await self._store.async_remove()
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Get the data to store."""
+        return {"platforms": self.platforms}
@@ -1,9 +1,8 @@
 """Climate platform for Gecko."""
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from geckolib import GeckoAsyncFacade, GeckoWaterCare, GeckoWaterHeater
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
     ClimateEntityFeature,
@@ -14,9 +13,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CLIMATE, DOMAIN
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib import GeckoAsyncFacade, GeckoWaterCare, GeckoWaterHeater
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,30 +27,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up climate platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    if spaman.facade is not None and spaman.facade.water_heater.is_available:
-        facade: GeckoAsyncFacade = spaman.facade
-        async_add_entities(
-            [
-                GeckoClimate(
-                    spaman,
-                    entry,
-                    facade.water_heater,
-                    facade.water_care,
-                )
-            ]
+    await spaman.async_setup_platform(CLIMATE, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the climate entities for the spa."""
+    if not spaman.can_use_facade or spaman.facade is None:
+        return []
+    facade: GeckoAsyncFacade = spaman.facade
+    if not facade.water_heater.is_available:
+        return []
+    return [
+        GeckoClimate(
+            spaman,
+            entry,
+            facade.water_heater,
+            facade.water_care,
         )
-    spaman.platform_loaded(CLIMATE)
+    ]
 
 
 class GeckoClimate(GeckoEntity, ClimateEntity):
     """Gecko Climate class."""
 
+    _attr_icon = "mdi:hot-tub"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         config_entry: ConfigEntry,
-        automation_entity: GeckoWaterHeater,
-        water_care: GeckoWaterCare,
+        automation_entity: "GeckoWaterHeater",
+        water_care: "GeckoWaterCare",
     ) -> None:
         """Initialize Gecko climate entity."""
         self._attr_hvac_modes = [HVACMode.AUTO]
@@ -59,12 +70,8 @@ class GeckoClimate(GeckoEntity, ClimateEntity):
         super().__init__(spaman, config_entry, automation_entity)
         self._water_care = water_care
         if self._water_care.is_available:
-            self._water_care.watch(self._on_change)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of the sensor."""
-        return "mdi:hot-tub"
+            self._watch(self._water_care)
+        self._update_attrs()
 
     @property
     def hvac_action(self) -> str:
@@ -78,17 +85,19 @@ class GeckoClimate(GeckoEntity, ClimateEntity):
         """List the water care modes."""
         return self._water_care.modes
 
-    @property
-    def preset_mode(self) -> str | None:
-        """Get the current preset mode."""
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set the preset mode asynchronously."""
+        await self._async_send_optimistic(
+            {"preset_mode": (preset_mode, self._actual_preset_mode)},
+            self._water_care.async_set_mode,
+            preset_mode,
+        )
+
+    def _actual_preset_mode(self) -> str:
         if self._water_care.mode is None:
             return "Waiting..."
         return self._water_care.modes[self._water_care.mode]
 
-    async def async_set_preset_mode(self, preset_mode: str) -> None:
-        """Set the preset mode asynchronously."""
-        await self._water_care.async_set_mode(preset_mode)
-
     @property
     def temperature_unit(self) -> str:
         """Get the current temperature unit."""
@@ -102,7 +111,9 @@ class GeckoClimate(GeckoEntity, ClimateEntity):
     @property
     def target_temperature(self) -> float:
         """Get the current target temperature."""
-        return self._automation_entity.target_temperature
+        return self._optimistic_value(
+            "target_temperature", self._automation_entity.target_temperature
+        )
 
     @property
     def min_temp(self) -> float:
@@ -116,8 +127,20 @@ class GeckoClimate(GeckoEntity, ClimateEntity):
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature asyncronously."""
-        await self._automation_entity.async_set_target_temperature(
-            kwargs["temperature"]
+        temperature = kwargs["temperature"]
+        await self._async_send_optimistic(
+            {"target_temperature": (temperature, self._actual_target_temperature)},
+            self._automation_entity.async_set_target_temperature,
+            temperature,
+        )
+
+    def _actual_target_temperature(self) -> float:
+        return self._automation_entity.target_temperature
+
+    def _update_attrs(self) -> None:
+        """Look up the name of the current water care mode."""
+        self._attr_preset_mode = self._optimistic_value(
+            "preset_mode", self._actual_preset_mode()
         )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -0,0 +1,105 @@
+"""GeckoCommandPipeline class coalesces the writes an entity sends to the spa."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeckoCommandPipeline:
+    """
+    Send an entity's commands with at most one write in flight.
+
+    While a write is in flight, a new call replaces the pending call to the
+    same command, so dragging a slider sends the first value and then the
+    last value rather than every step in between. Calls to different
+    commands, like a fan's preset and its speed, are each sent in turn. A
+    replaced call's keyword arguments are merged into the new one so that,
+    for example, a colour and a brightness change to a light are not lost,
+    and the command moves to the back of the queue so the last request
+    still wins. Positional arguments are replaced rather than merged, so
+    callers pass anything that should survive coalescing as keywords. Every
+    caller waits until the write that carries its request has completed,
+    and sees any error that write raised.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the command pipeline."""
+        self.name = name
+        self._pending: dict[
+            Callable[..., Awaitable[Any]],
+            tuple[tuple[Any, ...], dict[str, Any], list[asyncio.Future[None]]],
+        ] = {}
+        self._task: asyncio.Task | None = None
+
+        self.writes_requested = 0
+        self.writes_sent = 0
+
+    async def async_send(
+        self, command: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> None:
+        """Queue a command, replacing a call to it that has not been sent yet."""
+        self.writes_requested += 1
+        waiters: list[asyncio.Future[None]] = []
+        if (pending := self._pending.pop(command, None)) is not None:
+            _, pending_kwargs, waiters = pending
+            kwargs = {**pending_kwargs, **kwargs}
+
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        waiters.append(waiter)
+        self._pending[command] = (args, kwargs, waiters)
+        if self._task is None:
+            self._task = loop.create_task(self._async_drain())
+        await waiter
+
+    async def _async_drain(self) -> None:
+        """Send the pending commands, oldest first, until there are no more."""
+        try:
+            while self._pending:
+                command = next(iter(self._pending))
+                args, kwargs, waiters = self._pending.pop(command)
+                self.writes_sent += 1
+                try:
+                    await command(*args, **kwargs)
+                except asyncio.CancelledError:
+                    for waiter in waiters:
+                        waiter.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug("%s command failed: %s", self.name, err)
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            self._task = None
+            # Only reached with commands pending when cancelled, don't leave
+            # their callers hanging
+            pending, self._pending = self._pending, {}
+            for _, _, waiters in pending.values():
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def cancel(self) -> None:
+        """Cancel any write in flight and drop the pending commands."""
+        if self._task is not None:
+            self._task.cancel()
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the pipeline counters."""
+        return {
+            "writes_requested": self.writes_requested,
+            "writes_sent": self.writes_sent,
+            "writes_coalesced": self.writes_requested - self.writes_sent,
+        }
@@ -1,9 +1,10 @@
 """Adds config flow for Gecko."""
 
+import asyncio
 import logging
 import socket
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -15,11 +16,24 @@ from .const import (  # pylint: disable=unused-import
     CONF_SPA_ADDRESS,
     CONF_SPA_IDENTIFIER,
     CONF_SPA_NAME,
+    CONFIG_FLOW_DISCOVERY_TIMEOUT,
+    DEFAULT_PING_STATISTICS_INTERVAL,
+    DIAGNOSTIC_DEADBAND_KEY,
+    DIAGNOSTIC_MIN_INTERVAL_KEY,
     DOMAIN,
+    JOURNAL_SIZE_KEY,
+    JOURNAL_SIZE_MAX,
+    PING_STATISTICS_INTERVAL_KEY,
     SHOW_PING_KEY,
-    STARTUP_MESSAGE,
+    TEMPERATURE_DEADBAND_KEY,
+    TEMPERATURE_MIN_INTERVAL_KEY,
+    TRACE_KEY,
 )
-from .spa_manager import GeckoSpaManager
+from .discovery import async_get_discovery_service
+from .spa_manager import GeckoSpaManager, async_hand_over
+
+if TYPE_CHECKING:
+    from geckolib import GeckoAsyncSpaDescriptor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,17 +41,16 @@ _LOGGER = logging.getLogger(__name__)
 class GeckoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Gecko."""
 
-    VERSION = 2
+    VERSION = 3
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
 
     def __init__(self) -> None:
         """Initialize the flow handler class."""
-        _LOGGER.info(STARTUP_MESSAGE)
-
         self._errors = {}
         self._static_ip = None
         self._client_id = f"{uuid.uuid4()}"
-        self._spaman = GeckoSpaManager(self._client_id, None, None)
+        self._spa_descriptors: list[GeckoAsyncSpaDescriptor] = []
+        self._discovery_task: asyncio.Task | None = None
 
     def async_show_user_form(self) -> ConfigFlowResult:
         """Let the user provide an IP address, or indicate they want to search."""
@@ -54,13 +67,13 @@ class GeckoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     def async_show_select_form(self) -> ConfigFlowResult:
         """Show the select a spa form."""
-        _LOGGER.info("Found %s on the network", self._spaman.spa_descriptors)
+        _LOGGER.info("Found %s on the network", self._spa_descriptors)
 
         # Let the user choose which spa to connect to
         data_schema = {
             vol.Required(
                 CONF_SPA_NAME,
-            ): vol.In([spa.name for spa in self._spaman.spa_descriptors]),
+            ): vol.In([spa.name for spa in self._spa_descriptors]),
         }
 
         return self.async_show_form(
@@ -69,30 +82,6 @@ class GeckoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=self._errors,
         )
 
-    async def _async_step_with_address(self, user_addr: str) -> ConfigFlowResult:
-        # Check that this is an IP address, or at least can be interpreted as one
-        try:
-            socket.inet_aton(user_addr)
-        except OSError:
-            self._errors["base"] = "not_ip"
-            return self.async_show_user_form()
-
-        # And that there is a spa there to connect to ...
-        await self._spaman.async_set_spa_info(user_addr, None, None)
-        await self._spaman.wait_for_descriptors()
-
-        if self._spaman.spa_descriptors is None:
-            self._errors["base"] = "no_spa"
-            return self.async_show_user_form()
-
-        if len(self._spaman.spa_descriptors) == 0:
-            self._errors["base"] = "no_spa"
-            return self.async_show_user_form()
-
-        self._static_ip = user_addr
-        self._errors = {}
-        return self.async_show_select_form()
-
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -101,33 +90,78 @@ class GeckoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is None:
             _LOGGER.info("Choose scan or address")
-            await self._spaman.__aenter__()
-            # Clear errors
-            self._errors = {}
             return self.async_show_user_form()
 
+        self._errors = {}
+        self._static_ip = None
         # We got something as an address ...
         if CONF_SPA_ADDRESS in user_input:
             user_addr = user_input[CONF_SPA_ADDRESS]
             _LOGGER.info("User provided address '%s'", user_addr)
-            return await self._async_step_with_address(user_addr)
-
-        _LOGGER.info("No address provided, so wait for scan to complete...")
-        await self._spaman.wait_for_descriptors()
-        _LOGGER.info("Scan is complete")
-
-        if self._spaman.spa_descriptors is None:
-            # There are no spas found on your network
-            _LOGGER.warning("No spas found on the local network")
-            return self.async_abort(reason="no_spas")
-
-        if len(self._spaman.spa_descriptors) == 0:
-            # There are no spas found on your network
-            _LOGGER.warning("No spas found on the local network")
-            return self.async_abort(reason="no_spas")
-
-        self._errors = {}
-        return self.async_show_select_form()
+            # Check that this is an IP address, or at least can be interpreted
+            # as one
+            try:
+                socket.inet_aton(user_addr)
+            except OSError:
+                self._errors["base"] = "not_ip"
+                return self.async_show_user_form()
+            self._static_ip = user_addr
+        else:
+            _LOGGER.info("No address provided, so scan the network")
+
+        return await self.async_step_discover()
+
+    async def async_step_discover(
+        self,
+        user_input: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> ConfigFlowResult:
+        """Look for spas without blocking the flow."""
+        if self._discovery_task is None:
+            self._discovery_task = self.hass.async_create_task(
+                self._async_discover(), "Gecko config flow discovery"
+            )
+        if not self._discovery_task.done():
+            return self.async_show_progress(
+                step_id="discover",
+                progress_action="discover",
+                progress_task=self._discovery_task,
+            )
+
+        task, self._discovery_task = self._discovery_task, None
+        try:
+            self._spa_descriptors = task.result()
+        except TimeoutError:
+            _LOGGER.warning("Timed out looking for spas")
+            self._spa_descriptors = []
+        except (asyncio.CancelledError, Exception):
+            # Most likely the network refused the broadcast, or the shared scan
+            # was stopped, so let the user try again
+            _LOGGER.exception("Looking for spas failed")
+            self._errors["base"] = "discovery_failed"
+            return self.async_show_progress_done(next_step_id="user")
+
+        if self._spa_descriptors:
+            return self.async_show_progress_done(next_step_id="pick")
+        if self._static_ip is not None:
+            # And that there is a spa there to connect to ...
+            self._errors["base"] = "no_spa"
+            return self.async_show_progress_done(next_step_id="user")
+        # There are no spas found on your network
+        _LOGGER.warning("No spas found on the local network")
+        return self.async_show_progress_done(next_step_id="no_spas")
+
+    async def _async_discover(self) -> list["GeckoAsyncSpaDescriptor"]:
+        """Find spas using the shared, cached discovery service."""
+        async with asyncio.timeout(CONFIG_FLOW_DISCOVERY_TIMEOUT):
+            discovery = await async_get_discovery_service(self.hass)
+            return await discovery.async_discover(self._static_ip)
+
+    async def async_step_no_spas(
+        self,
+        user_input: dict[str, Any] | None = None,  # noqa: ARG002
+    ) -> ConfigFlowResult:
+        """Give up when there are no spas on the network."""
+        return self.async_abort(reason="no_spas")
 
     async def async_step_pick(
         self, user_input: dict[str, Any] | None = None
@@ -135,26 +169,51 @@ class GeckoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """After user has picked a spa."""
         _LOGGER.info("Async step user has picked {%s}", user_input)
 
+        if user_input is None:
+            return self.async_show_select_form()
+
         # We have previously selected a spaname from the list, so now
         # connect to the identifier for that spa
         spa_name = user_input[CONF_SPA_NAME]
         _LOGGER.info(
             "Previously, the user selected spa %s to configure, locate it in %s",
             spa_name,
-            self._spaman.spa_descriptors,
+            self._spa_descriptors,
         )
 
-        spa = next(spa for spa in self._spaman.spa_descriptors if spa.name == spa_name)
+        spa = next(spa for spa in self._spa_descriptors if spa.name == spa_name)
         config_data = {
             CONF_SPA_NAME: spa_name,
             CONF_SPA_IDENTIFIER: spa.identifier_as_string,
             CONF_SPA_ADDRESS: self._static_ip,
             CONF_CLIENT_ID: self._client_id,
         }
+
+        # Start connecting now, async_setup_entry will take this manager over
+        # rather than discovering and connecting all over again
+        spaman = GeckoSpaManager(
+            self._client_id,
+            self.hass,
+            None,
+            await async_get_discovery_service(self.hass),
+            spa_identifier=spa.identifier_as_string,
+            spa_address=self._static_ip,
+            spa_name=spa_name,
+        )
+        await spaman.__aenter__()
+        async_hand_over(self.hass, self._client_id, spaman)
+
         return self.async_create_entry(
             title=user_input[CONF_SPA_NAME], data=config_data
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Stop looking for spas if the flow is abandoned."""
+        if self._discovery_task is not None:
+            self._discovery_task.cancel()
+            self._discovery_task = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> config_entries.OptionsFlow:
@@ -191,7 +250,31 @@ class GeckoOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Required(
                         SHOW_PING_KEY, default=self.options.get(SHOW_PING_KEY, False)
-                    ): bool
+                    ): bool,
+                    vol.Required(
+                        PING_STATISTICS_INTERVAL_KEY,
+                        default=self.options.get(
+                            PING_STATISTICS_INTERVAL_KEY,
+                            DEFAULT_PING_STATISTICS_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Required(
+                        JOURNAL_SIZE_KEY, default=self.options.get(JOURNAL_SIZE_KEY, 0)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=JOURNAL_SIZE_MAX)),
+                    vol.Required(
+                        TRACE_KEY, default=self.options.get(TRACE_KEY, False)
+                    ): bool,
+                    **{
+                        vol.Required(key, default=self.options.get(key, 0)): vol.All(
+                            vol.Coerce(float), vol.Range(min=0)
+                        )
+                        for key in (
+                            TEMPERATURE_DEADBAND_KEY,
+                            TEMPERATURE_MIN_INTERVAL_KEY,
+                            DIAGNOSTIC_DEADBAND_KEY,
+                            DIAGNOSTIC_MIN_INTERVAL_KEY,
+                        )
+                    },
                 }
             ),
         )
@@ -1,20 +1,17 @@
 """Constants for Gecko."""
 
-import json
-import pathlib
-
-from geckolib import VERSION as GECKOLIB_VERSION
-
-# Base component constants, some loaded directly from the manifest
-_LOADER_PATH = pathlib.Path(__loader__.path)
-_MANIFEST_PATH = _LOADER_PATH.parent / "manifest.json"
-with pathlib.Path.open(_MANIFEST_PATH, encoding="Latin1") as json_file:
-    data = json.load(json_file)
-NAME = f"{data['name']}"
-DOMAIN = f"{data['domain']}"
+# Base component constants, the rest of the metadata is read from the manifest
+# when it is needed, see async_startup_message
+DOMAIN = "gecko"
 DOMAIN_DATA = f"{DOMAIN}_data"
-VERSION = f"{data['version']}"
-ISSUE_URL = f"{data['issue_tracker']}"
+DISCOVERY_DATA = f"{DOMAIN}_discovery"
+HANDOVER_DATA = f"{DOMAIN}_handover"
+
+# GeckoSpaManager.async_locate_spas stands in for the geckolib method of the
+# same name and relies on its private state, so it is only used with the
+# geckolib release it was written against. Keep this in step with the
+# geckolib requirement in manifest.json.
+GECKOLIB_LOCATE_VERSION = "1.0.15"
 
 # Icons
 ICON = "mdi:format-quote-close"
@@ -50,6 +47,37 @@ PLATFORMS = [
 
 # Option keys
 SHOW_PING_KEY = "show_ping"
+JOURNAL_SIZE_KEY = "journal_size"
+TEMPERATURE_DEADBAND_KEY = "temperature_deadband"
+TEMPERATURE_MIN_INTERVAL_KEY = "temperature_min_interval"
+DIAGNOSTIC_DEADBAND_KEY = "diagnostic_deadband"
+DIAGNOSTIC_MIN_INTERVAL_KEY = "diagnostic_min_interval"
+PING_STATISTICS_INTERVAL_KEY = "ping_statistics_interval"
+TRACE_KEY = "trace"
+
+# Performance tuning
+UPDATE_FRAME_TIME = 0.05
+EVENT_SETTLE_TIME = 0.25
+OPTIMISTIC_TIMEOUT = 10.0
+DISCOVERY_CACHE_TIME = 60
+CONFIG_FLOW_DISCOVERY_TIMEOUT = 30
+ENDPOINT_PROBE_TIMEOUT = 2
+HANDOVER_TIMEOUT = 60
+
+# Storage
+CATALOG_VERSION = 1
+CATALOG_SAVE_DELAY = 30
+ENDPOINTS_VERSION = 1
+ENDPOINTS_SAVE_DELAY = 10
+
+# Diagnostics
+STATE_HISTORY_SIZE = 50
+SNAPSHOT_DIRECTORY = "snapshots"
+SNAPSHOT_RETENTION = 10
+JOURNAL_SIZE_MAX = 100_000
+PING_STATISTICS_SIZE = 512
+TRACE_DIRECTORY = "traces"
+TRACE_MAX_EVENTS = 20_000
 
 # Configuration and options
 CONF_SPA_NAME = "spaname"
@@ -59,15 +87,16 @@ CONF_CLIENT_ID = "clientid"
 
 # Defaults
 DEFAULT_NAME = DOMAIN
+DEFAULT_PING_STATISTICS_INTERVAL = 300
 
 
-STARTUP_MESSAGE = f"""
+STARTUP_MESSAGE = """
 -------------------------------------------------------------------
-{NAME}
-Version: {VERSION}
-Gecko Lib: {GECKOLIB_VERSION}
+{name}
+Version: {version}
+Gecko Lib: {geckolib_version}
 This is a custom integration!
 If you have any issues with this you need to open an issue here:
-{ISSUE_URL}
+{issue_url}
 -------------------------------------------------------------------
 """
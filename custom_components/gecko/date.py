@@ -1,7 +1,7 @@
 """Date platform for Gecko."""
 
 import logging
-from datetime import UTC, date, datetime, timedelta
+from datetime import UTC, date, datetime
 from typing import Any
 
 from geckolib import GeckoReminderType
@@ -23,18 +23,24 @@ async def async_setup_entry(
 ) -> None:
     """Set up date platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+    await spaman.async_setup_platform(DATE, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the date entities for the spa."""
     dates: list = []
     if (
         spaman.can_use_facade
         and spaman.facade is not None
-        and spaman.facade.reminders_manager.is_available
+        and spaman.reminder_dispatcher is not None
     ):
         dates.extend(
             GeckoReminderDate(spaman, entry, reminder.reminder_type)
             for reminder in spaman.facade.reminders_manager.reminders
         )
-    async_add_entities(dates)
-    spaman.platform_loaded(DATE)
+    return dates
 
 
 class GeckoDate(GeckoEntity, DateEntity):
@@ -59,6 +65,8 @@ class GeckoDate(GeckoEntity, DateEntity):
 class GeckoReminderDate(GeckoEntityBase, DateEntity):
     """Gecko reminder sensor class."""
 
+    _attr_icon = "mdi:reminder"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
@@ -74,22 +82,22 @@ class GeckoReminderDate(GeckoEntityBase, DateEntity):
             spaman.spa_name,
         )
         self._reminder_type = reminder_type
-        self.spaman.facade.reminders_manager.watch(self._on_change)
-        self._entity_category = EntityCategory.CONFIG
+        self._source = spaman.reminder_dispatcher
+        self._attr_entity_category = EntityCategory.CONFIG
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for changes to this reminder when added to HA."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._source.subscribe(self._reminder_type, self._on_change)
+        )
 
     @property
     def native_value(self) -> datetime | None:
         """Get the sensor native value."""
-        if self.spaman.facade is None:
+        if self.spaman.reminder_dispatcher is None:
             return None
-        reminder = self.spaman.facade.reminders_manager.get_reminder(
-            self._reminder_type
-        )
-        if reminder is None:
-            return None
-        today = datetime.now(tz=UTC).date()
-        midnight = datetime(today.year, today.month, today.day, 0, 0, 0, 0, UTC)
-        return midnight + timedelta(reminder.days)
+        return self.spaman.reminder_dispatcher.due(self._reminder_type)
 
     async def async_set_value(self, value: date) -> None:
         """Update the current value."""
@@ -112,11 +120,6 @@ class GeckoReminderDate(GeckoEntityBase, DateEntity):
         """Get device class."""
         return "timestamp"
 
-    @property
-    def icon(self) -> str:
-        """Get icon."""
-        return "mdi:reminder"
-
     @staticmethod
     def type_to_name(thetype: GeckoReminderType) -> str:  # noqa: PLR0911
         """Convert type to name."""
@@ -134,8 +137,3 @@ class GeckoReminderDate(GeckoEntityBase, DateEntity):
         if thetype == GeckoReminderType.CHANGE_VISION_CARTRIDGE:
             return "Change Vision cartridge"
         return "Unknown"
-
-    def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
-        """Notify HA of the change."""
-        if self.hass is not None:
-            self.async_schedule_update_ha_state(force_refresh=True)
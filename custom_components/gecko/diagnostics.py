@@ -0,0 +1,110 @@
+"""Diagnostics support for Gecko."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import (
+    CONF_CLIENT_ID,
+    CONF_SPA_ADDRESS,
+    CONF_SPA_IDENTIFIER,
+    DISCOVERY_DATA,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .discovery import GeckoDiscoveryService
+    from .spa_manager import GeckoSpaManager
+
+TO_REDACT = {CONF_CLIENT_ID, CONF_SPA_ADDRESS, CONF_SPA_IDENTIFIER}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+
+    # The snapshot holds library and pack versions and the status block, none
+    # of which name the spa or its address, so it is reported as is
+    snapshot = None
+    if spaman.can_use_facade and spaman.facade is not None:
+        snapshot = spaman.facade.spa.get_snapshot_data()
+
+    commands = {"writes_requested": 0, "writes_sent": 0}
+    filters = {"passed": 0, "suppressed": 0}
+    for entity in spaman.entities:
+        if (counters := entity.command_counters) is not None:
+            commands["writes_requested"] += counters["writes_requested"]
+            commands["writes_sent"] += counters["writes_sent"]
+        if (counters := entity.filter_counters) is not None:
+            filters["passed"] += counters["passed"]
+            filters["suppressed"] += counters["suppressed"]
+
+    # Don't start the discovery service just to report on it
+    discovery: GeckoDiscoveryService | None = hass.data.get(DISCOVERY_DATA)
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "spa": {
+            "state": str(spaman.spa_state),
+            "can_use_facade": spaman.can_use_facade,
+            "handed_over": spaman.handed_over,
+            "facade_ready_after_seconds": spaman.facade_ready_after,
+            "state_transitions": [
+                {
+                    "time": datetime.fromtimestamp(timestamp, tz=UTC).isoformat(),
+                    "state": state,
+                }
+                for timestamp, state in spaman.state_history
+            ],
+        },
+        "platforms": spaman.platforms,
+        "resources": spaman.resource_counters,
+        "shared": {
+            "entries": len(hass.data[DOMAIN]),
+            "tasks": sum(
+                other.resource_counters["tasks"] for other in hass.data[DOMAIN].values()
+            ),
+            "sockets": sum(
+                other.resource_counters["sockets"]
+                for other in hass.data[DOMAIN].values()
+            ),
+            "discovery": None if discovery is None else discovery.counters,
+        },
+        "event_queue": spaman.event_counters,
+        "reloads": spaman.reload_counters,
+        "update_scheduler": spaman.update_scheduler.counters,
+        "ping": {
+            **spaman.ping_statistics.summary(),
+            "received": spaman.ping_statistics.received_total,
+            "missed": spaman.ping_statistics.missed_total,
+        },
+        "commands": commands,
+        "filters": filters,
+        "entities": {
+            entity.unique_id: {
+                "entity_id": entity.entity_id,
+                "available": entity.available,
+                "observer_callbacks": entity.change_callbacks,
+                "state_writes": entity.state_writes,
+                "commands": entity.command_counters,
+                "optimistic": entity.optimistic_counters,
+                "filter": entity.filter_counters,
+            }
+            for entity in spaman.entities
+        },
+        "observers": spaman.observer_report(),
+        "journal": (
+            None
+            if spaman.journal is None
+            else {**spaman.journal.counters, "changes": spaman.journal.export()}
+        ),
+        "snapshot": snapshot,
+    }
@@ -0,0 +1,286 @@
+"""GeckoDiscoveryService class shares spa discovery between config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from geckolib import GeckoAsyncLocator, GeckoAsyncTaskMan, GeckoSpaEvent
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DISCOVERY_CACHE_TIME,
+    DISCOVERY_DATA,
+    DOMAIN,
+    ENDPOINT_PROBE_TIMEOUT,
+    ENDPOINTS_SAVE_DELAY,
+    ENDPOINTS_VERSION,
+)
+
+if TYPE_CHECKING:
+    from geckolib import GeckoAsyncSpaDescriptor
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeckoDiscoveryService:
+    """
+    One discovery service per Home Assistant, shared by every spa manager.
+
+    A broadcast is answered by every spa on the network, so rather than each
+    manager and config flow opening its own socket and broadcasting, they
+    share a single scan per address. Replies are demultiplexed by spa
+    identifier, so a manager waiting for one spa returns as soon as that spa
+    answers, and the descriptors are cached for later callers.
+
+    The last address each spa answered from is persisted, and a manager that
+    knows its spa identifier probes that address before broadcasting.
+
+    Each scan runs its locator in a task manager of its own, so scans of
+    different addresses can run side by side and their tasks are gone once
+    the scan ends.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the discovery service."""
+        self.hass = hass
+        self._descriptors: dict[str, tuple[float, GeckoAsyncSpaDescriptor]] = {}
+        self._scans: dict[str | None, asyncio.Task] = {}
+        self._last_broadcast: float | None = None
+        self._waiters: dict[str, list[asyncio.Future[GeckoAsyncSpaDescriptor]]] = {}
+        self._store: Store = Store(hass, ENDPOINTS_VERSION, f"{DOMAIN}.endpoints")
+        self._endpoints: dict[str, dict[str, Any]] = {}
+        self._unsaved = False
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+        self.scans = 0
+        self.scans_joined = 0
+        self.cache_hits = 0
+        self.probes = 0
+        self.probe_hits = 0
+        self.seconds_saved = 0.0
+
+    async def async_load(self) -> None:
+        """Load the known spa endpoints."""
+        data = await self._store.async_load()
+        if data is not None:
+            self._endpoints = data.get("endpoints", {})
+        _LOGGER.debug("Loaded %d spa endpoints", len(self._endpoints))
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_stop
+        )
+
+    async def _async_on_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Stop any running scans and write out the known endpoints."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        scans = list(self._scans.values())
+        for scan in scans:
+            scan.cancel()
+        await asyncio.gather(*scans, return_exceptions=True)
+        if self._unsaved:
+            await self._store.async_save(self._endpoints_data())
+            self._unsaved = False
+        _LOGGER.debug("Discovery service closed")
+
+    def cached(self, spa_identifier: str) -> GeckoAsyncSpaDescriptor | None:
+        """Get the descriptor for a spa if it was seen recently."""
+        cached = self._descriptors.get(spa_identifier)
+        if cached is None or time.monotonic() - cached[0] > DISCOVERY_CACHE_TIME:
+            return None
+        return cached[1]
+
+    async def async_discover(
+        self, spa_address: str | None = None, spa_identifier: str | None = None
+    ) -> list[GeckoAsyncSpaDescriptor]:
+        """
+        Find spas, from the cache if possible.
+
+        With an identifier, this returns as soon as that spa has answered,
+        otherwise it returns everything found by a complete scan.
+        """
+        if spa_identifier is not None:
+            descriptor = self.cached(spa_identifier)
+            if descriptor is not None and spa_address in (None, descriptor.ipaddress):
+                self.cache_hits += 1
+                return [descriptor]
+        elif spa_address is None and self._broadcast_is_fresh():
+            self.cache_hits += 1
+            return self.descriptors
+
+        if spa_identifier is None:
+            # The scan is shared, so a caller giving up mustn't cancel it for
+            # everyone else waiting on it, and a scan stopped by closing the
+            # service just finds nothing
+            await asyncio.wait([self._scan(spa_address)])
+            if spa_address is None:
+                return self.descriptors
+            return [
+                descriptor
+                for descriptor in self.descriptors
+                if descriptor.ipaddress == spa_address
+            ]
+
+        if spa_address is None and spa_identifier in self._endpoints:
+            descriptors = await self._async_probe(spa_identifier)
+            if descriptors:
+                return descriptors
+
+        started = time.monotonic()
+        descriptors = await self._async_wait_for(
+            self._scan(spa_address), spa_identifier
+        )
+        if descriptors and spa_address is None:
+            self._endpoints[spa_identifier]["broadcast_time"] = (
+                time.monotonic() - started
+            )
+            self._async_save_endpoints()
+        return descriptors
+
+    async def _async_probe(self, spa_identifier: str) -> list[GeckoAsyncSpaDescriptor]:
+        """Try the address a spa last answered from before broadcasting."""
+        endpoint = self._endpoints[spa_identifier]
+        self.probes += 1
+        started = time.monotonic()
+        descriptors = await self._async_wait_for(
+            self._scan(endpoint["address"]), spa_identifier, ENDPOINT_PROBE_TIMEOUT
+        )
+        if not descriptors:
+            _LOGGER.debug(
+                "%s did not answer at %s, broadcast instead",
+                spa_identifier,
+                endpoint["address"],
+            )
+            return []
+        self.probe_hits += 1
+        if (broadcast_time := endpoint.get("broadcast_time")) is not None:
+            self.seconds_saved += max(
+                0.0, broadcast_time - (time.monotonic() - started)
+            )
+        return descriptors
+
+    async def _async_wait_for(
+        self, scan: asyncio.Task, spa_identifier: str, limit: float | None = None
+    ) -> list[GeckoAsyncSpaDescriptor]:
+        """Wait for a spa to answer a scan."""
+        waiter: asyncio.Future[GeckoAsyncSpaDescriptor] = self.hass.loop.create_future()
+        self._waiters.setdefault(spa_identifier, []).append(waiter)
+        try:
+            await asyncio.wait(
+                [waiter, scan], timeout=limit, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiters = self._waiters.get(spa_identifier, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+        if waiter.done():
+            return [waiter.result()]
+        waiter.cancel()
+        return []
+
+    @property
+    def descriptors(self) -> list[GeckoAsyncSpaDescriptor]:
+        """Get the recently seen spa descriptors."""
+        now = time.monotonic()
+        return [
+            descriptor
+            for seen, descriptor in self._descriptors.values()
+            if now - seen <= DISCOVERY_CACHE_TIME
+        ]
+
+    def _broadcast_is_fresh(self) -> bool:
+        return (
+            self._last_broadcast is not None
+            and time.monotonic() - self._last_broadcast <= DISCOVERY_CACHE_TIME
+        )
+
+    def _scan(self, spa_address: str | None) -> asyncio.Task:
+        """Get the scan for an address, starting one if none is running."""
+        scan = self._scans.get(spa_address)
+        if scan is not None:
+            self.scans_joined += 1
+            return scan
+        self.scans += 1
+        scan = self.hass.async_create_background_task(
+            self._async_scan(spa_address), f"Gecko discovery {spa_address}"
+        )
+        self._scans[spa_address] = scan
+        return scan
+
+    async def _async_scan(self, spa_address: str | None) -> None:
+        """Run one locator and record everything it finds."""
+        _LOGGER.debug("Start discovery on %s", spa_address or "broadcast")
+        try:
+            async with GeckoAsyncTaskMan() as taskman:
+                locator = GeckoAsyncLocator(
+                    taskman, self._async_on_event, spa_address=spa_address
+                )
+                await locator.discover()
+            if spa_address is None:
+                self._last_broadcast = time.monotonic()
+        finally:
+            self._scans.pop(spa_address, None)
+
+    async def _async_on_event(self, event: GeckoSpaEvent, **kwargs: Any) -> None:
+        """Cache discovered spas and wake anyone waiting for them."""
+        if event != GeckoSpaEvent.LOCATING_DISCOVERED_SPA:
+            return
+        descriptor: GeckoAsyncSpaDescriptor = kwargs["spa_descriptor"]
+        spa_identifier = descriptor.identifier_as_string
+        _LOGGER.debug("Discovered %r", descriptor)
+        self._descriptors[spa_identifier] = (time.monotonic(), descriptor)
+        endpoint = self._endpoints.setdefault(spa_identifier, {})
+        if endpoint.get("address") != descriptor.ipaddress:
+            endpoint["address"] = descriptor.ipaddress
+            self._async_save_endpoints()
+        for waiter in self._waiters.pop(spa_identifier, []):
+            if not waiter.done():
+                waiter.set_result(descriptor)
+
+    def _endpoints_data(self) -> dict[str, Any]:
+        self._unsaved = False
+        return {"endpoints": self._endpoints}
+
+    def _async_save_endpoints(self) -> None:
+        self._unsaved = True
+        self._store.async_delay_save(self._endpoints_data, ENDPOINTS_SAVE_DELAY)
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the discovery counters."""
+        return {
+            "scans": self.scans,
+            "scans_joined": self.scans_joined,
+            "cache_hits": self.cache_hits,
+            "active_scans": len(self._scans),
+            "descriptors": len(self._descriptors),
+            "endpoints": len(self._endpoints),
+            "probes": self.probes,
+            "probe_hits": self.probe_hits,
+            "seconds_saved": self.seconds_saved,
+        }
+
+
+async def async_get_discovery_service(hass: HomeAssistant) -> GeckoDiscoveryService:
+    """Get the discovery service with its known endpoints loaded."""
+    service = hass.data.get(DISCOVERY_DATA)
+    if service is None:
+        service = hass.data[DISCOVERY_DATA] = GeckoDiscoveryService(hass)
+        await service.async_load()
+    return service
+
+
+async def async_close_discovery_service(hass: HomeAssistant) -> None:
+    """Close the discovery service, if it was started."""
+    service: GeckoDiscoveryService | None = hass.data.pop(DISCOVERY_DATA, None)
+    if service is not None:
+        await service.async_close()
@@ -1,16 +1,27 @@
 """GeckoEntity class."""
 
+from __future__ import annotations
+
+import contextlib
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from geckolib import GeckoAutomationBase, Observable
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 
-from .const import DOMAIN
-from .spa_manager import GeckoSpaManager
+from .command_pipeline import GeckoCommandPipeline
+from .optimistic import GeckoOptimisticState
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.device_registry import DeviceInfo
+
+    from .spa_manager import GeckoSpaManager
+    from .state_filter import GeckoStateFilter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 class GeckoEntityBase(Entity):
     """Base for all Gecko entities."""
 
+    # We're a push model
+    _attr_should_poll = False
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
@@ -32,55 +46,153 @@ class GeckoEntityBase(Entity):
         self._unique_id = unique_id
         self._name = name
         self._parent_name = parent_name
-        self._entity_category: str | None = None
+        self._attr_unique_id = unique_id
+        self._attr_name = f"{parent_name}: {name}"
+        self._source: Any = None
+        self._observables: list[Observable] = []
+        self.change_callbacks = 0
+        self.state_writes = 0
+        self._commands: GeckoCommandPipeline | None = None
+        self._optimistic: GeckoOptimisticState | None = None
+        self._state_filter: GeckoStateFilter | None = None
         _LOGGER.info("Setup entity %r", self)
 
     @property
-    def unique_id(self) -> str:
-        """Return a unique ID to use for this entity."""
-        return self._unique_id
+    def source(self) -> Any:
+        """Return the geckolib object this entity represents."""
+        return self._source
+
+    def _watch(self, observable: Observable) -> None:
+        """Watch an observable once the entity has been added to HA."""
+        self._observables.append(observable)
+
+    async def async_added_to_hass(self) -> None:
+        """Start watching for changes when added to HA."""
+        await super().async_added_to_hass()
+        for observable in self._observables:
+            observable.watch(self._on_change)
+            self.spaman.track_observer(self, observable)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop watching for changes when removed from HA."""
+        if self._commands is not None:
+            self._commands.cancel()
+        if self._optimistic is not None:
+            self._optimistic.cancel()
+        if self._state_filter is not None:
+            self._state_filter.cancel()
+        for observable in self._observables:
+            with contextlib.suppress(ValueError):
+                observable.unwatch(self._on_change)
+        await super().async_will_remove_from_hass()
 
     @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return f"{self._parent_name}: {self._name}"
+    def commands(self) -> GeckoCommandPipeline:
+        """Get the pipeline that coalesces this entity's writes to the spa."""
+        if self._commands is None:
+            self._commands = GeckoCommandPipeline(repr(self))
+        return self._commands
 
     @property
-    def device_info(self) -> DeviceInfo | None:
-        """Get device information."""
-        info = DeviceInfo()
-        info["identifiers"] = {(DOMAIN, self.spaman.unique_id)}
-        info["name"] = self.spaman.spa_name
-        info["manufacturer"] = "Gecko Alliance"
-        if self.spaman.facade is not None:
-            info["model"] = (
-                f"{self.spaman.facade.spa.pack} {self.spaman.facade.spa.version}"
-            )
-            info["sw_version"] = (
-                f"SpaPack:v{self.spaman.facade.spa.revision} "
-                f"Config:{self.spaman.facade.spa.config_version} "
-                f"Log:{self.spaman.facade.spa.log_version}"
-            )
-            info["hw_version"] = (
-                f"EN:{self.spaman.facade.spa.intouch_version_en} "
-                f"CO:{self.spaman.facade.spa.intouch_version_co}"
-            )
-        return info
+    def command_counters(self) -> dict[str, Any] | None:
+        """Get the command pipeline counters, if any commands have been sent."""
+        return None if self._commands is None else self._commands.counters
 
     @property
-    def entity_category(self) -> str | None:
-        """Return the entity category."""
-        return self._entity_category
+    def optimistic_counters(self) -> dict[str, Any] | None:
+        """Get the optimistic state statistics, if any have been requested."""
+        return None if self._optimistic is None else self._optimistic.counters
 
     @property
-    def extra_state_attributes(self) -> str | None:
-        """Return the extra state attributes."""
-        return None
+    def filter_counters(self) -> dict[str, Any] | None:
+        """Get the state filter counters, if the entity's writes are filtered."""
+        return None if self._state_filter is None else self._state_filter.counters
+
+    def _optimistic_value(self, key: str, actual: Any) -> Any:
+        """Get the value to show for an attribute that may be optimistic."""
+        if self._optimistic is None:
+            return actual
+        return self._optimistic.get(key, actual)
+
+    async def _async_send_optimistic(
+        self,
+        values: dict[str, tuple[Any, Callable[[], Any]]],
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Show the requested values straight away, then send the command.
+
+        The values map each attribute to the requested value and a reader for
+        the value the spa reports, which is used to confirm the request.
+        """
+        if self._optimistic is None:
+            self._optimistic = GeckoOptimisticState(repr(self))
+        if self._optimistic.expect(self.hass, values, self._async_refresh):
+            self._async_refresh()
+        try:
+            await self.commands.async_send(command, *args, **kwargs)
+        except Exception:
+            self._optimistic.rollback("command failed")
+            self._async_refresh()
+            raise
 
     @property
-    def should_poll(self) -> bool:
-        """Return false as we're a push model."""
-        return False
+    def device_info(self) -> DeviceInfo | None:
+        """Get device information."""
+        return self.spaman.device_info
+
+    def _update_attrs(self) -> None:
+        """
+        Refresh the _attr_ values that follow the geckolib object.
+
+        Entities whose attributes change with the spa compute them here, so a
+        state write just reads them rather than working them out again. This
+        is called on every change notification and whenever the optimistic
+        state changes.
+        """
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Refresh the _attr_ values and write the state."""
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    def _on_change(self, _sender: Any, old_value: Any, new_value: Any) -> None:
+        """Notify HA of the change."""
+        self.change_callbacks += 1
+        if self.spaman.journal is not None:
+            self.spaman.journal.record(self._unique_id, old_value, new_value)
+        if self._optimistic is not None and self._optimistic.pending:
+            self._optimistic.check()
+        self._update_attrs()
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        """Schedule a state write unless the state filter holds it back."""
+        if self.hass is None:
+            return
+        if self._state_filter is not None and not self._state_filter.allow(
+            self.hass, self._schedule_write
+        ):
+            return
+        self.spaman.update_scheduler.schedule(self)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to HA, counting the writes for diagnostics."""
+        self.state_writes += 1
+        super().async_write_ha_state()
+
+    def catalog_record(self) -> dict[str, Any]:
+        """Describe this entity so it can be restored before the facade is ready."""
+        return {
+            "name": self._name,
+            "parent_name": self._parent_name,
+            "icon": self.icon,
+            "entity_category": self.entity_category,
+        }
 
     def __repr__(self) -> str:
         """Return a unique name."""
@@ -106,12 +218,28 @@ class GeckoEntity(GeckoEntityBase):
             automation_entity.parent_name,
         )
         self._automation_entity = automation_entity
+        self._source = automation_entity
         if isinstance(automation_entity, Observable):
-            self._automation_entity.watch(self._on_change)
+            self._watch(automation_entity)
         if entity_category is not None:
-            self._entity_category = entity_category
+            self._attr_entity_category = entity_category
 
-    def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
-        """Notify HA of the change."""
-        if self.hass is not None:
-            self.async_schedule_update_ha_state(force_refresh=True)
+
+class GeckoCatalogEntity(GeckoEntityBase):
+    """Unavailable stand-in for a catalogued entity until the facade is ready."""
+
+    def __init__(
+        self,
+        spaman: GeckoSpaManager,
+        config_entry: ConfigEntry,
+        unique_id: str,
+        record: dict[str, Any],
+    ) -> None:
+        """Initialize a catalog entity from its record."""
+        super().__init__(
+            spaman, config_entry, unique_id, record["name"], record["parent_name"]
+        )
+        self._attr_available = False
+        self._attr_icon = record.get("icon")
+        if record.get("entity_category") is not None:
+            self._attr_entity_category = EntityCategory(record["entity_category"])
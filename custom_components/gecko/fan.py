@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, FAN
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 
 if TYPE_CHECKING:
     from .spa_manager import GeckoSpaManager
@@ -20,19 +20,48 @@ async def async_setup_entry(
 ) -> None:
     """Set up fan platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    if spaman.facade is not None:
-        async_add_entities(
-            [
-                GeckoFan(spaman, entry, pump)
-                for pump in list(spaman.facade.pumps + spaman.facade.blowers)
-            ]
-        )
-    spaman.platform_loaded(FAN)
+    await spaman.async_setup_platform(FAN, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: "GeckoSpaManager", entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the fan entities for the spa."""
+    if not spaman.can_use_facade or spaman.facade is None:
+        return []
+    return [
+        GeckoFan(spaman, entry, pump)
+        for pump in list(spaman.facade.pumps + spaman.facade.blowers)
+    ]
 
 
 class GeckoFan(GeckoEntity, FanEntity):
     """GeckoFan class."""
 
+    def __init__(
+        self,
+        spaman: "GeckoSpaManager",
+        config_entry: ConfigEntry,
+        automation_entity: GeckoPump,
+    ) -> None:
+        """Initialize the fan, working out what it is and what it supports."""
+        super().__init__(spaman, config_entry, automation_entity)
+        features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+        if self.pump.pump_type == GeckoPump.PumpType.TWO_SPEED:
+            features |= FanEntityFeature.PRESET_MODE
+        if self.pump.pump_type == GeckoPump.PumpType.VARIABLE_SPEED:
+            features |= FanEntityFeature.SET_SPEED
+        self._attr_supported_features = features
+
+        if isinstance(automation_entity, GeckoBlower):
+            self._attr_icon = "mdi:fan"
+        elif isinstance(automation_entity, GeckoWaterfall):
+            self._attr_icon = "mdi:waterfall"
+        elif isinstance(automation_entity, GeckoBubbleGenerator):
+            self._attr_icon = "mdi:chart-bubble"
+        else:
+            self._attr_icon = "mdi:pump"
+
     async def async_turn_on(
         self,
         _speed: str | None = None,
@@ -41,45 +70,49 @@ class GeckoFan(GeckoEntity, FanEntity):
         **_kwargs: Any,
     ) -> None:
         """Turn on the switch."""
-        await self.pump.async_turn_on(percentage, preset_mode)
+        values = {"is_on": (True, self._actual_is_on)}
+        # Only what was asked for is sent, as keywords, so a speed change
+        # coalesced with this doesn't lose the preset, or the other way round
+        kwargs: dict[str, Any] = {}
+        if percentage is not None:
+            kwargs["percentage"] = percentage
+        if preset_mode is not None:
+            values["preset_mode"] = (preset_mode, self._actual_preset_mode)
+            kwargs["preset_mode"] = preset_mode
+        await self._async_send_optimistic(values, self.pump.async_turn_on, **kwargs)
 
     async def async_turn_off(self, **_kwarg: Any) -> None:
         """Turn off the switch."""
-        await self.pump.async_turn_off()
+        await self._async_send_optimistic(
+            {"is_on": (False, self._actual_is_on)}, self.pump.async_turn_off
+        )
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        await self.pump.async_turn_on(percentage, None)
+        await self._async_send_optimistic(
+            {"is_on": (percentage > 0, self._actual_is_on)},
+            self.pump.async_turn_on,
+            percentage=percentage,
+        )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the fan preset mode."""
-        await self.pump.async_set_mode(preset_mode)
+        await self._async_send_optimistic(
+            {"preset_mode": (preset_mode, self._actual_preset_mode)},
+            self.pump.async_set_mode,
+            preset_mode,
+        )
 
-    @property
-    def is_on(self) -> bool:
-        """Get the fan on/off state."""
+    def _actual_is_on(self) -> bool:
         return self.pump.is_on
 
-    @property
-    def supported_features(self) -> FanEntityFeature:
-        """Get fan supported features."""
-        features = FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
-        if self.pump.pump_type == GeckoPump.PumpType.TWO_SPEED:
-            features |= FanEntityFeature.PRESET_MODE
-        if self.pump.pump_type == GeckoPump.PumpType.VARIABLE_SPEED:
-            features |= FanEntityFeature.SET_SPEED
-        return features
+    def _actual_preset_mode(self) -> str:
+        return self.pump.mode
 
     @property
-    def icon(self) -> str:
-        """Return the icon of this switch."""
-        if isinstance(self._automation_entity, GeckoBlower):
-            return "mdi:fan"
-        if isinstance(self._automation_entity, GeckoWaterfall):
-            return "mdi:waterfall"
-        if isinstance(self._automation_entity, GeckoBubbleGenerator):
-            return "mdi:chart-bubble"
-        return "mdi:pump"
+    def is_on(self) -> bool:
+        """Get the fan on/off state."""
+        return self._optimistic_value("is_on", self.pump.is_on)
 
     @property
     def preset_modes(self) -> list[str]:
@@ -89,7 +122,7 @@ class GeckoFan(GeckoEntity, FanEntity):
     @property
     def preset_mode(self) -> str:
         """Get current preset mode."""
-        return self.pump.mode
+        return self._optimistic_value("preset_mode", self.pump.mode)
 
     @property
     def percentage(self) -> int | None:
@@ -0,0 +1,51 @@
+"""GeckoChangeJournal class keeps the latest raw changes seen by the entities."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+
+class GeckoChangeJournal:
+    """
+    A fixed size ring of the raw geckolib changes the entities observed.
+
+    Each change is kept as a (timestamp, unique id, old, new) tuple and the
+    unique ids are the entities' own strings, so an entry costs little more
+    than the tuple itself. Once full, the oldest change is dropped for each
+    new one, so memory stays bounded however long it runs.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the journal."""
+        self._changes: deque[tuple[float, str, Any, Any]] = deque(maxlen=capacity)
+        self.recorded = 0
+
+    def record(self, unique_id: str, old_value: Any, new_value: Any) -> None:
+        """Record a change."""
+        self._changes.append((time.time(), unique_id, old_value, new_value))
+        self.recorded += 1
+
+    def export(self) -> list[dict[str, Any]]:
+        """Get the recorded changes, oldest first."""
+        return [
+            {
+                "time": datetime.fromtimestamp(timestamp, tz=UTC).isoformat(),
+                "unique_id": unique_id,
+                "old": old_value,
+                "new": new_value,
+            }
+            for timestamp, unique_id, old_value, new_value in self._changes
+        ]
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the journal counters."""
+        return {
+            "capacity": self._changes.maxlen,
+            "size": len(self._changes),
+            "recorded": self.recorded,
+            "dropped": self.recorded - len(self._changes),
+        }
@@ -1,8 +1,7 @@
 """Switch platform for Gecko."""
 
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from geckolib import GeckoAutomationFacadeBase, GeckoInMixZone
 from homeassistant.components.light import LightEntity
 from homeassistant.components.light.const import ColorMode
 from homeassistant.config_entries import ConfigEntry
@@ -10,34 +9,45 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, LIGHT
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib import GeckoAutomationFacadeBase, GeckoInMixZone
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up sensor platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    if spaman.facade is not None:
-        async_add_entities(
-            [GeckoLight(spaman, entry, light) for light in spaman.facade.lights]
+    await spaman.async_setup_platform(LIGHT, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the light entities for the spa."""
+    if not spaman.can_use_facade or spaman.facade is None:
+        return []
+    lights: list = [GeckoLight(spaman, entry, light) for light in spaman.facade.lights]
+    if spaman.facade.inmix.is_available:
+        lights.extend(
+            GeckoZone(spaman, entry, zone) for zone in spaman.facade.inmix.zones
         )
-        if spaman.facade.inmix.is_available:
-            async_add_entities(
-                [GeckoZone(spaman, entry, zone) for zone in spaman.facade.inmix.zones]
-            )
-    spaman.platform_loaded(LIGHT)
+    return lights
 
 
 class GeckoLight(GeckoEntity, LightEntity):
     """Gecko light class."""
 
+    _attr_icon = "mdi:lightbulb"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         entry: ConfigEntry,
-        light: GeckoAutomationFacadeBase,
+        light: "GeckoAutomationFacadeBase",
     ) -> None:
         """Initialize the light."""
         super().__init__(spaman, entry, light)
@@ -46,31 +56,37 @@ class GeckoLight(GeckoEntity, LightEntity):
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on the switch."""
-        await self._automation_entity.async_turn_on()
+        await self._async_send_optimistic(
+            {"is_on": (True, self._actual_is_on)},
+            self._automation_entity.async_turn_on,
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off the switch."""
-        await self._automation_entity.async_turn_off()
+        await self._async_send_optimistic(
+            {"is_on": (False, self._actual_is_on)},
+            self._automation_entity.async_turn_off,
+        )
 
-    @property
-    def icon(self) -> str:
-        """Return the icon of this light."""
-        return "mdi:lightbulb"
+    def _actual_is_on(self) -> bool:
+        return self._automation_entity.is_on
 
     @property
     def is_on(self) -> bool:
         """Return true if the light is on."""
-        return self._automation_entity.is_on
+        return self._optimistic_value("is_on", self._automation_entity.is_on)
 
 
 class GeckoZone(GeckoEntity, LightEntity):
     """Gecko zone class."""
 
+    _attr_icon = "mdi:lightbulb"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         entry: ConfigEntry,
-        zone: GeckoAutomationFacadeBase,
+        zone: "GeckoAutomationFacadeBase",
     ) -> None:
         """Initialize the zone."""
         super().__init__(spaman, entry, zone)
@@ -79,16 +95,11 @@ class GeckoZone(GeckoEntity, LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self._zone.async_turn_on(**kwargs)
+        await self.commands.async_send(self._zone.async_turn_on, **kwargs)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        await self._zone.async_turn_off(**kwargs)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of this light."""
-        return "mdi:lightbulb"
+        await self.commands.async_send(self._zone.async_turn_off, **kwargs)
 
     @property
     def is_on(self) -> bool:
@@ -106,5 +117,5 @@ class GeckoZone(GeckoEntity, LightEntity):
         return self._zone.brightness
 
     @property
-    def _zone(self) -> GeckoInMixZone:
-        return cast(GeckoInMixZone, self._automation_entity)
+    def _zone(self) -> "GeckoInMixZone":
+        return cast("GeckoInMixZone", self._automation_entity)
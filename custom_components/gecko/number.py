@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, NUMBER
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 
 if TYPE_CHECKING:
     from .spa_manager import GeckoSpaManager
@@ -23,6 +23,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up number platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+    await spaman.async_setup_platform(NUMBER, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: "GeckoSpaManager", entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the number entities for the spa."""
     numbers: list = []
     if spaman.can_use_facade and spaman.facade is not None:
         if spaman.facade.mrsteam.is_available:
@@ -60,9 +67,7 @@ async def async_setup_entry(
                     EntityCategory.CONFIG,
                 )
             )
-
-    async_add_entities(numbers)
-    spaman.platform_loaded(NUMBER)
+    return numbers
 
 
 class GeckoNumber(GeckoEntity, NumberEntity):
@@ -85,7 +90,9 @@ class GeckoNumber(GeckoEntity, NumberEntity):
 
     async def async_set_native_value(self, new_value: float) -> None:
         """Set the value of the number entity."""
-        await self._automation_entity.async_set_native_value(new_value)
+        await self.commands.async_send(
+            self._automation_entity.async_set_native_value, new_value
+        )
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -0,0 +1,134 @@
+"""GeckoOptimisticState class tracks requested state awaiting spa confirmation."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import OPTIMISTIC_TIMEOUT
+
+if TYPE_CHECKING:
+    from asyncio import TimerHandle
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeckoOptimisticState:
+    """
+    The state an entity has asked the spa for but not yet seen echoed back.
+
+    Each expected attribute carries a reader for the real value. Attributes
+    are confirmed one by one as change notifications show the reader agreeing,
+    and whatever has not been confirmed when the timeout expires is dropped so
+    the entity falls back to what the spa reports.
+    """
+
+    def __init__(self, name: str, timeout: float = OPTIMISTIC_TIMEOUT) -> None:
+        """Initialize the optimistic state."""
+        self.name = name
+        self._timeout = timeout
+        self._expected: dict[str, tuple[Any, Callable[[], Any]]] = {}
+        self._requested_at = 0.0
+        self._handle: TimerHandle | None = None
+
+        self.requested = 0
+        self.confirmed = 0
+        self.rolled_back = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latency_last: float | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Determine if any state is awaiting confirmation."""
+        return bool(self._expected)
+
+    def get(self, key: str, actual: Any) -> Any:
+        """Get the requested value for an attribute, or the actual one."""
+        expected = self._expected.get(key)
+        return actual if expected is None else expected[0]
+
+    def expect(
+        self,
+        hass: HomeAssistant,
+        values: dict[str, tuple[Any, Callable[[], Any]]],
+        on_timeout: Callable[[], None],
+    ) -> bool:
+        """Record the requested values, returning True if any are pending."""
+        values = {
+            key: (value, reader)
+            for key, (value, reader) in values.items()
+            if reader() != value
+        }
+        if not values:
+            return False
+        if not self._expected:
+            self._requested_at = time.monotonic()
+            self.requested += 1
+        self._expected.update(values)
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = hass.loop.call_later(self._timeout, self._timed_out, on_timeout)
+        return True
+
+    def check(self) -> None:
+        """Confirm the attributes that the spa now agrees with."""
+        self._expected = {
+            key: (value, reader)
+            for key, (value, reader) in self._expected.items()
+            if reader() != value
+        }
+        if self._expected:
+            return
+        latency = time.monotonic() - self._requested_at
+        self.confirmed += 1
+        self._latency_last = latency
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+        self._cancel_timer()
+
+    def rollback(self, reason: str) -> None:
+        """Drop everything awaiting confirmation."""
+        if not self._expected:
+            return
+        _LOGGER.warning(
+            "%s: rolled back %s, %s", self.name, sorted(self._expected), reason
+        )
+        self._expected.clear()
+        self.rolled_back += 1
+        self._cancel_timer()
+
+    def cancel(self) -> None:
+        """Forget the requested state without counting a rollback."""
+        self._expected.clear()
+        self._cancel_timer()
+
+    def _timed_out(self, on_timeout: Callable[[], None]) -> None:
+        """Roll back when the spa has not confirmed in time."""
+        self._handle = None
+        self.rollback(f"spa did not confirm within {self._timeout}s")
+        on_timeout()
+
+    def _cancel_timer(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the confirmation statistics."""
+        return {
+            "requested": self.requested,
+            "confirmed": self.confirmed,
+            "rolled_back": self.rolled_back,
+            "pending": self.pending,
+            "latency_last": self._latency_last,
+            "latency_mean": (
+                self._latency_total / self.confirmed if self.confirmed else None
+            ),
+            "latency_max": self._latency_max if self.confirmed else None,
+        }
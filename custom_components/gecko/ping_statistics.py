@@ -0,0 +1,53 @@
+"""GeckoPingStatistics class keeps a rolling window of spa ping results."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+
+class GeckoPingStatistics:
+    """
+    Whether each of the most recent pings was lost.
+
+    The window is a preallocated array of bytes used as a ring, so it costs
+    one byte a ping however long it runs, and the number lost is kept as
+    results come and go so summarising it is cheap.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the statistics."""
+        self._lost = array("B", [0] * size)
+        self._next = 0
+        self._count = 0
+        self._lost_in_window = 0
+
+        self.received_total = 0
+        self.missed_total = 0
+
+    def received(self) -> None:
+        """Record a ping that was answered."""
+        self._add(0)
+        self.received_total += 1
+
+    def missed(self) -> None:
+        """Record a ping that was not answered."""
+        self._add(1)
+        self.missed_total += 1
+
+    def _add(self, lost: int) -> None:
+        if self._count == len(self._lost):
+            self._lost_in_window -= self._lost[self._next]
+        self._lost[self._next] = lost
+        self._lost_in_window += lost
+        self._next = (self._next + 1) % len(self._lost)
+        self._count = min(self._count + 1, len(self._lost))
+
+    def summary(self) -> dict[str, Any]:
+        """Summarise the window."""
+        return {
+            "loss_rate": (
+                round(self._lost_in_window / self._count, 3) if self._count else None
+            ),
+            "samples": self._count,
+        }
@@ -0,0 +1,112 @@
+"""GeckoReminderDispatcher class shares reminder state between entities."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from geckolib import GeckoReminderType
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _utc_midnight() -> datetime:
+    """Get the most recent UTC midnight."""
+    today = datetime.now(tz=UTC).date()
+    return datetime(today.year, today.month, today.day, 0, 0, 0, 0, UTC)
+
+
+class GeckoReminderDispatcher:
+    """
+    Watch the reminders manager once and tell entities about their reminder.
+
+    The due timestamps are computed when the reminder days change and again
+    at UTC midnight, and only the listeners for reminders whose due time has
+    actually changed get notified.
+    """
+
+    def __init__(self, hass: HomeAssistant | None, reminders_manager: Any) -> None:
+        """Initialize the reminder dispatcher."""
+        self.hass: HomeAssistant | None = hass
+        self._reminders_manager = reminders_manager
+        self._midnight = _utc_midnight()
+        self._due: dict[GeckoReminderType, datetime | None] = {}
+        self._listeners: dict[
+            GeckoReminderType, list[Callable[[Any, Any, Any], None]]
+        ] = {}
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+
+    def start(self) -> None:
+        """Start watching the reminders."""
+        self._reminders_manager.watch(self._on_change)
+        self._update()
+        if self.hass is not None:
+            self._unsub_midnight = async_track_utc_time_change(
+                self.hass, self._on_midnight, hour=0, minute=0, second=0
+            )
+
+    def stop(self) -> None:
+        """Stop watching the reminders."""
+        # A disconnected facade has already dropped its observers
+        with contextlib.suppress(ValueError):
+            self._reminders_manager.unwatch(self._on_change)
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        self._listeners.clear()
+
+    def due(self, reminder_type: GeckoReminderType) -> datetime | None:
+        """Get the due timestamp for a reminder."""
+        return self._due.get(reminder_type)
+
+    def subscribe(
+        self,
+        reminder_type: GeckoReminderType,
+        listener: Callable[[Any, Any, Any], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for changes to a reminder, returning an unsubscribe callback."""
+        listeners = self._listeners.setdefault(reminder_type, [])
+        listeners.append(listener)
+
+        @callback
+        def _unsubscribe() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return _unsubscribe
+
+    def _update(self) -> None:
+        """Recompute the due timestamps and notify those that have changed."""
+        for reminder in self._reminders_manager.reminders:
+            reminder_type = reminder.reminder_type
+            due = (
+                None
+                if reminder.days is None
+                else self._midnight + timedelta(reminder.days)
+            )
+            old_due = self._due.get(reminder_type)
+            if due == old_due and reminder_type in self._due:
+                continue
+            self._due[reminder_type] = due
+            for listener in list(self._listeners.get(reminder_type, [])):
+                listener(self, old_due, due)
+
+    def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
+        """Handle a change on the reminders manager."""
+        self._update()
+
+    @callback
+    def _on_midnight(self, _now: datetime) -> None:
+        """Move the due timestamps on at midnight."""
+        self._midnight = _utc_midnight()
+        _LOGGER.debug("Reminder midnight rollover to %s", self._midnight)
+        self._update()
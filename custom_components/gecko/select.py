@@ -1,9 +1,8 @@
 """Switch platform for Gecko."""  # noqa: A005
 
 import logging
-from multiprocessing.spawn import spawn_main
+from typing import TYPE_CHECKING
 
-from geckolib import GeckoAutomationFacadeBase
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
@@ -11,9 +10,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, SELECT
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib import GeckoAutomationFacadeBase
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -22,9 +24,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up select platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+    await spaman.async_setup_platform(SELECT, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the select entities for the spa."""
+    selects: list = []
     if spaman.can_use_facade:
         assert spaman.facade is not None  # noqa: S101
-        selects = []
         if spaman.facade.heatpump.is_available:
             selects.append(GeckoHeatPump(spaman, entry, spaman.facade.heatpump))
         if spaman.facade.ingrid.is_available:
@@ -53,9 +62,7 @@ async def async_setup_entry(
             selects.append(
                 GeckoSelect(spaman, entry, spaman.facade.bainultra.drying_cycle)
             )
-
-        async_add_entities(selects)
-    spaman.platform_loaded(SELECT)
+    return selects
 
 
 class GeckoSelect(GeckoEntity, SelectEntity):
@@ -65,17 +72,17 @@ class GeckoSelect(GeckoEntity, SelectEntity):
         self,
         spaman: GeckoSpaManager,
         entry: ConfigEntry,
-        select: GeckoAutomationFacadeBase,
+        select: "GeckoAutomationFacadeBase",
     ) -> None:
         """Initialize the select."""
         super().__init__(spaman, entry, select)
-        self._entity_category = EntityCategory.CONFIG
+        self._attr_entity_category = EntityCategory.CONFIG
         _LOGGER.debug("%r loaded. Options are %s", select, select.states)
 
     @property
     def current_option(self) -> str:
         """Get the current option."""
-        return self._automation_entity.state
+        return self._optimistic_value("current_option", self._automation_entity.state)
 
     @property
     def options(self) -> list[str]:
@@ -84,90 +91,95 @@ class GeckoSelect(GeckoEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await self._automation_entity.async_set_state(option)
+        await self._async_send_optimistic(
+            {"current_option": (option, self._actual_option)},
+            self._automation_entity.async_set_state,
+            option,
+        )
+
+    def _actual_option(self) -> str:
+        return self._automation_entity.state
 
 
 class GeckoHeatPump(GeckoSelect):
     """Heat Pump class."""
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for the heatpump."""
-        return "mdi:heat-pump-outline"
+    _attr_icon = "mdi:heat-pump-outline"
 
 
 class GeckoInGrid(GeckoSelect):
     """InGrid class."""
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for the heatpump."""
-        return "mdi:heat-wave"
+    _attr_icon = "mdi:heat-wave"
 
 
 class GeckoBainBackrest(GeckoSelect):
     """Bain backrest class."""
 
+    _attr_icon = "mdi:heat-wave"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         entry: ConfigEntry,
-        select: GeckoAutomationFacadeBase,
+        select: "GeckoAutomationFacadeBase",
     ) -> None:
         """Initialize the backrest select."""
         super().__init__(spaman, entry, select)
-        self._entity_category = None
-
-    @property
-    def icon(self) -> str:
-        """Get the icon for the backrest."""
-        return "mdi:heat-wave"
+        self._attr_entity_category = None
 
 
 class GeckoBainChroma(GeckoSelect):
     """Bain chroma class."""
 
+    _attr_icon = "mdi:looks"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         entry: ConfigEntry,
-        select: GeckoAutomationFacadeBase,
+        select: "GeckoAutomationFacadeBase",
     ) -> None:
         """Initialize the chroma select."""
         super().__init__(spaman, entry, select)
-        self._entity_category = None
-
-    @property
-    def icon(self) -> str:
-        """Get the icon for the chroma."""
-        return "mdi:looks"
+        self._attr_entity_category = None
 
 
 class GeckoLockMode(GeckoSelect):
     """Lockmode class."""
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for the lock."""
-        if self.current_option == "Unlocked":
-            return "mdi:lock-open-variant-outline"
-        if self.current_option.startswith("Partial"):
-            return "mdi:lock-minus-outline"
-        return "mdi:lock-outline"
+    def __init__(
+        self,
+        spaman: GeckoSpaManager,
+        entry: ConfigEntry,
+        select: "GeckoAutomationFacadeBase",
+    ) -> None:
+        """Initialize the lock mode select."""
+        super().__init__(spaman, entry, select)
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """Pick the icon for the lock mode."""
+        option = self.current_option
+        if option == "Unlocked":
+            self._attr_icon = "mdi:lock-open-variant-outline"
+        elif option.startswith("Partial"):
+            self._attr_icon = "mdi:lock-minus-outline"
+        else:
+            self._attr_icon = "mdi:lock-outline"
 
 
 class GeckoKeypadBacklight(GeckoSelect):
     """Keypad Backlight class."""
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for the keypad."""
-        return "mdi:alarm-panel-outline"
+    _attr_icon = "mdi:alarm-panel-outline"
 
 
 class GeckoWatercare(GeckoSelect):
     """Watercare class."""
 
+    _attr_icon = "mdi:water-check"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
@@ -176,15 +188,12 @@ class GeckoWatercare(GeckoSelect):
         """Initialize the watercare select."""
         super().__init__(spaman, entry, spaman.facade.water_care)
 
-    @property
-    def icon(self) -> str:
-        """Get the icon for watercare."""
-        return "mdi:water-check"
-
 
 class GeckoInMixSync(GeckoSelect):
     """inMix sync class."""
 
+    _attr_icon = "mdi:alarm-panel-outline"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
@@ -192,9 +201,4 @@ class GeckoInMixSync(GeckoSelect):
     ) -> None:
         """Initialize the inmix select."""
         super().__init__(spaman, entry, spaman.facade.inmix.syncro)
-        self._entity_category = None
-
-    @property
-    def icon(self) -> str:
-        """Get the icon for the sync class."""
-        return "mdi:alarm-panel-outline"
+        self._attr_entity_category = None
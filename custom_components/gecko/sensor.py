@@ -1,20 +1,37 @@
 """Sensor platform for Gecko."""
 
 import logging
-from datetime import UTC, datetime, timedelta
-from typing import Any
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-from geckolib import GeckoAutomationBase, GeckoErrorSensor, GeckoReminderType
-from homeassistant.components.sensor import SensorEntity
+from geckolib import GeckoReminderType
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN, SENSOR
+from .const import (
+    DEFAULT_PING_STATISTICS_INTERVAL,
+    DIAGNOSTIC_DEADBAND_KEY,
+    DIAGNOSTIC_MIN_INTERVAL_KEY,
+    DOMAIN,
+    PING_STATISTICS_INTERVAL_KEY,
+    SENSOR,
+    TEMPERATURE_DEADBAND_KEY,
+    TEMPERATURE_MIN_INTERVAL_KEY,
+)
 from .entity import GeckoEntity, GeckoEntityBase
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib import GeckoAutomationBase, GeckoErrorSensor
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -23,15 +40,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
+    await spaman.async_setup_platform(SENSOR, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the sensor entities for the spa."""
     sensors: list = []
     if spaman.status_sensor is not None:
         sensors.append(
             GeckoSensor(spaman, entry, spaman.status_sensor, EntityCategory.DIAGNOSTIC)
         )
     if spaman.show_ping_sensor and spaman.ping_sensor is not None:
-        sensors.append(
-            GeckoSensor(spaman, entry, spaman.ping_sensor, EntityCategory.DIAGNOSTIC)
-        )
+        sensors.append(GeckoPingStatisticsSensor(spaman, entry))
     if spaman.radio_sensor is not None:
         sensors.append(
             GeckoSensor(spaman, entry, spaman.radio_sensor, EntityCategory.DIAGNOSTIC)
@@ -65,7 +87,7 @@ async def async_setup_entry(
         sensors.extend(
             GeckoSensor(spaman, entry, sensor) for sensor in spaman.facade.sensors
         )
-        if spaman.facade.reminders_manager.is_available:
+        if spaman.reminder_dispatcher is not None:
             sensors.extend(
                 GeckoReminderSensor(spaman, entry, reminder.reminder_type)
                 for reminder in spaman.facade.reminders_manager.reminders
@@ -75,13 +97,44 @@ async def async_setup_entry(
             sensors.append(
                 GeckoSensor(spaman, entry, spaman.facade.mrsteam.remaining_runtime)
             )
-    async_add_entities(sensors)
-    spaman.platform_loaded(SENSOR)
+    return sensors
 
 
 class GeckoSensor(GeckoEntity, SensorEntity):
     """Gecko Sensor class."""
 
+    def __init__(
+        self,
+        spaman: GeckoSpaManager,
+        config_entry: ConfigEntry,
+        automation_entity: "GeckoAutomationBase",
+        entity_category: EntityCategory | None = None,
+    ) -> None:
+        """Initialize the sensor, filtering its writes if the options ask to."""
+        super().__init__(spaman, config_entry, automation_entity, entity_category)
+        # Measurements get long term statistics, so their raw history can be
+        # purged sooner, and the radio diagnostics are rarely looked at
+        if (
+            automation_entity is spaman.radio_sensor
+            or self.device_class == SensorDeviceClass.TEMPERATURE
+        ):
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        if automation_entity in (spaman.radio_sensor, spaman.channel_sensor):
+            self._attr_entity_registry_enabled_default = False
+            self._state_filter = spaman.state_filter(
+                DIAGNOSTIC_DEADBAND_KEY, DIAGNOSTIC_MIN_INTERVAL_KEY, self._filter_value
+            )
+        elif self.device_class == SensorDeviceClass.TEMPERATURE:
+            self._state_filter = spaman.state_filter(
+                TEMPERATURE_DEADBAND_KEY,
+                TEMPERATURE_MIN_INTERVAL_KEY,
+                self._filter_value,
+            )
+
+    def _filter_value(self) -> Any:
+        """Get the value the state filter compares."""
+        return self.native_value
+
     @property
     def native_value(self) -> Any:
         """Return the native value of the sensor."""
@@ -101,6 +154,8 @@ class GeckoSensor(GeckoEntity, SensorEntity):
 class GeckoReminderSensor(GeckoEntityBase, SensorEntity):
     """Gecko reminder sensor class."""
 
+    _attr_icon = "mdi:reminder"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
@@ -116,21 +171,21 @@ class GeckoReminderSensor(GeckoEntityBase, SensorEntity):
             spaman.spa_name,
         )
         self._reminder_type = reminder_type
-        self.spaman.facade.reminders_manager.watch(self._on_change)
+        self._source = spaman.reminder_dispatcher
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for changes to this reminder when added to HA."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._source.subscribe(self._reminder_type, self._on_change)
+        )
 
     @property
     def native_value(self) -> datetime | None:
         """Get the sensor native value."""
-        if self.spaman.facade is None:
+        if self.spaman.reminder_dispatcher is None:
             return None
-        reminder = self.spaman.facade.reminders_manager.get_reminder(
-            self._reminder_type
-        )
-        if reminder is None:
-            return None
-        today = datetime.now(tz=UTC).date()
-        midnight = datetime(today.year, today.month, today.day, 0, 0, 0, 0, UTC)
-        return midnight + timedelta(reminder.days)
+        return self.spaman.reminder_dispatcher.due(self._reminder_type)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -142,11 +197,6 @@ class GeckoReminderSensor(GeckoEntityBase, SensorEntity):
         """Get device class."""
         return "timestamp"
 
-    @property
-    def icon(self) -> str:
-        """Get icon."""
-        return "mdi:reminder"
-
     @staticmethod
     def type_to_name(thetype: GeckoReminderType) -> str:  # noqa: PLR0911
         """Convert type to name."""
@@ -165,20 +215,17 @@ class GeckoReminderSensor(GeckoEntityBase, SensorEntity):
             return "Change Vision cartridge"
         return "Unknown"
 
-    def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
-        """Notify HA of the change."""
-        if self.hass is not None:
-            self.async_schedule_update_ha_state(force_refresh=True)
-
 
 class GeckoErrorTextSensor(GeckoEntityBase, SensorEntity):
     """Gecko text error sensor class."""
 
+    _attr_icon = "mdi:alert"
+
     def __init__(
         self,
         spaman: GeckoSpaManager,
         config_entry: ConfigEntry,
-        error_sensor: GeckoErrorSensor,
+        error_sensor: "GeckoErrorSensor",
     ) -> None:
         """Initialize the error text sensor."""
         super().__init__(
@@ -189,8 +236,9 @@ class GeckoErrorTextSensor(GeckoEntityBase, SensorEntity):
             spaman.spa_name,
         )
         self._error_sensor = error_sensor
-        self._error_sensor.watch(self._on_change)
-        self._entity_category = EntityCategory.DIAGNOSTIC
+        self._source = error_sensor
+        self._watch(error_sensor)
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def native_value(self) -> str | None:
@@ -204,16 +252,6 @@ class GeckoErrorTextSensor(GeckoEntityBase, SensorEntity):
         """Get unit of measurement."""
         return None
 
-    @property
-    def icon(self) -> str:
-        """Get icon."""
-        return "mdi:alert"
-
-    def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
-        """Notify HA of the change."""
-        if self.hass is not None:
-            self.async_schedule_update_ha_state(force_refresh=True)
-
 
 class GeckoCurrentTemperatureSensor(GeckoSensor):
     """Current temperature sensor."""
@@ -222,15 +260,77 @@ class GeckoCurrentTemperatureSensor(GeckoSensor):
         self,
         spaman: GeckoSpaManager,
         config_entry: ConfigEntry,
-        automation_entity: GeckoAutomationBase,
-        valid_entity: GeckoAutomationBase,
+        automation_entity: "GeckoAutomationBase",
+        valid_entity: "GeckoAutomationBase",
         entity_category: EntityCategory | None = None,
     ) -> None:
         """Initialize the current temp sensor."""
         super().__init__(spaman, config_entry, automation_entity, entity_category)
         self.valid_entity = valid_entity
-        self.valid_entity.watch(self._on_change)
+        self._watch(valid_entity)
+
+    def _filter_value(self) -> Any:
+        """Get the value the state filter compares, None when unavailable."""
+        return self.native_value if self._attr_available else None
 
     def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
         self._attr_available = self.valid_entity.is_available
         return super()._on_change(_sender, _old_value, _new_value)
+
+
+class GeckoPingStatisticsSensor(GeckoEntityBase, SensorEntity):
+    """
+    Spa ping loss, published periodically rather than on every ping.
+
+    The state is the percentage of pings lost over the spa manager's window
+    of recent pings. geckolib doesn't time its pings, so there are no round
+    trip times to publish.
+    """
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:lan-pending"
+    _unrecorded_attributes = frozenset({"samples"})
+
+    def __init__(self, spaman: GeckoSpaManager, config_entry: ConfigEntry) -> None:
+        """Initialize the ping statistics sensor."""
+        super().__init__(
+            spaman,
+            config_entry,
+            f"{spaman.unique_id}-PINGSTATS",
+            "Ping loss",
+            spaman.spa_name,
+        )
+        self._source = spaman.ping_statistics
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._interval = config_entry.options.get(
+            PING_STATISTICS_INTERVAL_KEY, DEFAULT_PING_STATISTICS_INTERVAL
+        )
+        self._summary = spaman.ping_statistics.summary()
+
+    async def async_added_to_hass(self) -> None:
+        """Publish the statistics on an interval when added to HA."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_publish, timedelta(seconds=self._interval)
+            )
+        )
+
+    @callback
+    def _async_publish(self, _now: datetime) -> None:
+        """Summarise the window and write the state."""
+        self._summary = self.spaman.ping_statistics.summary()
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Get the percentage of pings lost."""
+        if self._summary["loss_rate"] is None:
+            return None
+        return round(self._summary["loss_rate"] * 100, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Get the number of pings in the window."""
+        return {"samples": self._summary["samples"]}
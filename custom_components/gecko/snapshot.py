@@ -0,0 +1,49 @@
+"""Spa snapshot files written by the Snapshot button."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import slugify
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def write_snapshot(
+    directory: Path,
+    spa_name: str,
+    taken_at: datetime,
+    data: dict[str, Any],
+    retention: int,
+) -> Path:
+    """
+    Write a compressed snapshot file and prune the oldest ones for the spa.
+
+    The file holds the same SNAPSHOT line the button used to log, so once
+    decompressed it can be loaded by the geckolib simulator. The line is
+    written a key at a time rather than formatted in one go. This blocks, so
+    run it in the executor.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    prefix = slugify(spa_name)
+    path = directory / f"{prefix}-{taken_at:%Y%m%d-%H%M%S}.txt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write("SNAPSHOT ========{")
+        for index, (key, value) in enumerate(data.items()):
+            if index:
+                file.write(", ")
+            file.write(f"{key!r}: {value!r}")
+        file.write("}========\n")
+
+    # The timestamp in the name sorts the snapshots oldest first
+    snapshots = sorted(directory.glob(f"{prefix}-*.txt.gz"))
+    for old in snapshots[: max(0, len(snapshots) - retention)]:
+        _LOGGER.debug("Remove old snapshot %s", old)
+        old.unlink(missing_ok=True)
+    return path
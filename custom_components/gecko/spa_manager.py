@@ -4,23 +4,77 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+import weakref
+from collections import deque
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
+from geckolib import VERSION as GECKOLIB_VERSION
 from geckolib import GeckoAsyncSpaMan, GeckoSpaEvent
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 
+from .catalog import GeckoEntityCatalog
 from .const import (
+    BINARY_SENSOR,
     BUTTON,
+    CLIMATE,
+    DATE,
+    DOMAIN,
+    EVENT_SETTLE_TIME,
+    FAN,
+    GECKOLIB_LOCATE_VERSION,
+    HANDOVER_DATA,
+    HANDOVER_TIMEOUT,
+    JOURNAL_SIZE_KEY,
+    LIGHT,
+    NUMBER,
+    PING_STATISTICS_SIZE,
     PLATFORMS,
+    SELECT,
     SENSOR,
     SHOW_PING_KEY,
+    STATE_HISTORY_SIZE,
+    SWITCH,
+    TRACE_DIRECTORY,
+    WATER_HEATER,
 )
+from .entity import GeckoCatalogEntity
+from .journal import GeckoChangeJournal
+from .ping_statistics import GeckoPingStatistics
+from .reminders import GeckoReminderDispatcher
+from .state_filter import GeckoStateFilter
+from .tracer import GeckoTracer, write_trace
+from .update_scheduler import GeckoUpdateScheduler
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from geckolib import GeckoAsyncSpaDescriptor
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .discovery import GeckoDiscoveryService
+    from .entity import GeckoEntityBase
+
+    PlatformBuilder = Callable[["GeckoSpaManager", ConfigEntry], list[GeckoEntityBase]]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Events that change which entities exist. Only these are worth waiting for
+# others to settle, so the burst is reconciled once.
+RELOAD_EVENTS = frozenset(
+    {
+        GeckoSpaEvent.CLIENT_FACADE_IS_READY,
+        GeckoSpaEvent.CLIENT_HAS_RECONNECT_BUTTON,
+        GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
+        GeckoSpaEvent.CLIENT_FACADE_TEARDOWN,
+    }
+)
+
 
 class GeckoSpaManager(GeckoAsyncSpaMan):
     """HA Gecko Spa Manager."""
@@ -30,62 +84,392 @@ class GeckoSpaManager(GeckoAsyncSpaMan):
         client_id: str,
         hass: HomeAssistant | None,
         entry: ConfigEntry | None,
+        discovery: GeckoDiscoveryService | None = None,
+        tracer: GeckoTracer | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the Spa Manager."""
         super().__init__(client_id, **kwargs)
         self.hass: HomeAssistant | None = hass
         self.entry: ConfigEntry | None = entry
+        self.discovery: GeckoDiscoveryService | None = discovery
+        self.tracer = tracer if tracer is not None else GeckoTracer()
 
         self._can_use_facade = False
+        self._device_info: DeviceInfo | None = None
+        self.reminder_dispatcher: GeckoReminderDispatcher | None = None
 
         self.platforms = []
+        self._platform_setups: dict[
+            str, tuple[AddEntitiesCallback, PlatformBuilder]
+        ] = {}
+        self._entities: dict[str, dict[str, GeckoEntityBase]] = {}
+        self._observed_objects: weakref.WeakSet = weakref.WeakSet()
+        self._observing_entities: weakref.WeakSet = weakref.WeakSet()
         self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._event_queue_high_water = 0
+        self._reload_events = 0
+        self._reload_passes = 0
+        self._reload_count = 0
+        self._reload_time_total = 0.0
+        self._reload_time_max = 0.0
+        self._started_at: float | None = None
+        self._facade_ready_after: float | None = None
+        self._state_history: deque[tuple[float, str]] = deque(maxlen=STATE_HISTORY_SIZE)
+        self.update_scheduler = GeckoUpdateScheduler(hass)
+        self.ping_statistics = GeckoPingStatistics(PING_STATISTICS_SIZE)
+        self.handed_over = False
+        self.catalog: GeckoEntityCatalog | None = None
+        self.journal: GeckoChangeJournal | None = None
+        if hass is not None and entry is not None:
+            self.catalog = GeckoEntityCatalog(hass, entry.entry_id)
+            self._start_journal()
 
     async def __aenter__(self) -> Self:
         """Perform async enter."""
+        self._started_at = time.monotonic()
         await super().__aenter__()
-        self.add_task(
-            self._queue_loop(), "Home Assistant Gecko Spa Manager", "HASPAMAN"
-        )
+        if self.entry is not None:
+            self._start_queue_loop()
         return self
 
     async def __aexit__(self, *exc_info: object) -> None:
         """Support async with."""
         self.cancel_key_tasks("HASPAMAN")
+        self.update_scheduler.cancel()
+        self._stop_reminder_dispatcher()
+        _LOGGER.debug("Update scheduler %s", self.update_scheduler.counters)
         return await super().__aexit__(*exc_info)
 
+    def _start_queue_loop(self) -> None:
+        self.add_task(
+            self._queue_loop(), "Home Assistant Gecko Spa Manager", "HASPAMAN"
+        )
+
+    async def async_attach(
+        self, entry: ConfigEntry, tracer: GeckoTracer | None = None
+    ) -> None:
+        """
+        Attach a manager started by the config flow to its new config entry.
+
+        The spa events that arrived while connecting have been queued, so
+        they are processed as soon as the queue loop starts.
+        """
+        self.entry = entry
+        if tracer is not None:
+            self.tracer = tracer
+        self.handed_over = True
+        self.catalog = GeckoEntityCatalog(self.hass, entry.entry_id)
+        self._start_journal()
+        await self.async_load_catalog()
+        self._start_queue_loop()
+
+    def _start_journal(self) -> None:
+        """Keep a journal of raw changes if the options ask for one."""
+        capacity = self.entry.options.get(JOURNAL_SIZE_KEY, 0)
+        if capacity:
+            self.journal = GeckoChangeJournal(capacity)
+
     @property
     def can_use_facade(self) -> bool:
         """Determine if the facade is ready for use."""
         return self._can_use_facade
 
+    async def async_locate_spas(
+        self, spa_address: str | None = None, spa_identifier: str | None = None
+    ) -> list[GeckoAsyncSpaDescriptor] | None:
+        """Locate spas through the shared discovery service when there is one."""
+        # geckolib has no hook for replacing the locator, so this mirrors the
+        # base method, including its private event handler and descriptor
+        # state, which only holds for the release it was written against
+        if self.discovery is None or GECKOLIB_VERSION != GECKOLIB_LOCATE_VERSION:
+            return await super().async_locate_spas(spa_address, spa_identifier)
+
+        # The sequence pump locates without an identifier before connecting,
+        # but there is no need to wait for every spa when we know ours
+        spa_identifier = spa_identifier or self._spa_identifier
+        try:
+            await self._handle_event(GeckoSpaEvent.LOCATING_STARTED)
+            self._spa_descriptors = await self.discovery.async_discover(
+                spa_address, spa_identifier
+            )
+            self._has_descriptors.set()
+        finally:
+            await self._handle_event(
+                GeckoSpaEvent.LOCATING_FINISHED,
+                spa_descriptors=self._spa_descriptors,
+            )
+        return self._spa_descriptors
+
+    @property
+    def resource_counters(self) -> dict[str, Any]:
+        """Get the resources this spa manager is using, to attribute them per spa."""
+        scheduler = self.update_scheduler.counters
+        return {
+            "tasks": sum(not task.done() for task in self._tasks),
+            "sockets": 0 if self._spa is None else 1,
+            "entities": sum(len(entities) for entities in self._entities.values()),
+            "observed_objects": len(self._observed_objects),
+            "events": self._reload_events,
+            "changes_seen": scheduler["changes_seen"],
+            "state_writes": scheduler["state_writes"],
+            "loop_seconds": scheduler["flush_seconds"] + self._reload_time_total,
+        }
+
     async def _queue_loop(self) -> None:
         while True:
-            event = await self._event_queue.get()
+            events = await self._async_collect_events()
+            with self.tracer.span(
+                "process events", "events", events=[event.name for event in events]
+            ):
+                await self._async_process_events(events)
+
+    async def _async_collect_events(self) -> list[GeckoSpaEvent]:
+        """
+        Wait for an event, then gather any more that arrive while settling.
+
+        Only a reload event opens the settle window, anything else is handed
+        on at once. The facade being ready is what the other reload events
+        lead up to, so it closes the window early, taking only what is
+        already queued.
+        """
+        events = [await self._event_queue.get()]
+        if events[0] not in RELOAD_EVENTS:
+            return events
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + EVENT_SETTLE_TIME
+        while (
+            events[-1] != GeckoSpaEvent.CLIENT_FACADE_IS_READY
+            and (remaining := deadline - loop.time()) > 0
+        ):
+            try:
+                events.append(
+                    await asyncio.wait_for(self._event_queue.get(), remaining)
+                )
+            except TimeoutError:
+                break
+        while not self._event_queue.empty():
+            events.append(self._event_queue.get_nowait())
+        return events
+
+    async def _async_process_events(self, events: list[GeckoSpaEvent]) -> None:
+        """Apply a burst of events in order, then reconcile once."""
+        needs_reload = False
+        facade_ready = False
+        for event in events:
             if event == GeckoSpaEvent.CLIENT_FACADE_IS_READY:
-                # Wait for a single update so we have reminders and watercare
-                await self.facade.wait_for_one_update()
-                self._can_use_facade = True
-                await self.reload()
+                facade_ready = True
+                needs_reload = True
 
             elif event in [
                 GeckoSpaEvent.CLIENT_HAS_RECONNECT_BUTTON,
                 GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
             ]:
-                await self.reload()
+                needs_reload = True
 
             elif event == GeckoSpaEvent.CLIENT_FACADE_TEARDOWN:
+                # A teardown supersedes a facade ready earlier in the burst
+                facade_ready = False
                 self._can_use_facade = False
-                await self.reload()
+                self._device_info = None
+                self._stop_reminder_dispatcher()
+                needs_reload = True
+
+            else:
+                continue
+            self._reload_events += 1
+
+        if facade_ready and self.facade is not None:
+            # Wait for a single update so we have reminders and watercare
+            with self.tracer.span("wait_for_one_update", "events"):
+                await self.facade.wait_for_one_update()
+            self._can_use_facade = True
+            self._device_info = None
+            self._start_reminder_dispatcher()
+            if self._facade_ready_after is None and self._started_at is not None:
+                self._facade_ready_after = time.monotonic() - self._started_at
+
+        if needs_reload:
+            self._reload_passes += 1
+            await self.reload()
+
+    def _start_reminder_dispatcher(self) -> None:
+        """Start dispatching reminders from the current facade."""
+        self._stop_reminder_dispatcher()
+        if self.facade.reminders_manager.is_available:
+            self.reminder_dispatcher = GeckoReminderDispatcher(
+                self.hass, self.facade.reminders_manager
+            )
+            self.reminder_dispatcher.start()
+
+    def _stop_reminder_dispatcher(self) -> None:
+        """Stop dispatching reminders."""
+        if self.reminder_dispatcher is not None:
+            self.reminder_dispatcher.stop()
+            self.reminder_dispatcher = None
 
     async def handle_event(self, event: GeckoSpaEvent, **_kwargs: Any) -> None:
         """Handle spa manager events."""
         _LOGGER.debug("Event: %s, state %s", event, self.spa_state)
+        state = str(self.spa_state)
+        if not self._state_history or self._state_history[-1][1] != state:
+            self._state_history.append((time.time(), state))
+        if event in (
+            GeckoSpaEvent.RUNNING_PING_RECEIVED,
+            GeckoSpaEvent.RUNNING_PING_MISSED,
+        ):
+            self._record_ping(event)
+        else:
+            self._trace_event(event)
         # The Geckolib spa manager issues events as they happen, and sometimes
         # this is what you want, but for HA, we want to serialise some of them
         # because otherwise we end up trying to build platforms at the same time
         await self._event_queue.put(event)
+        self._event_queue_high_water = max(
+            self._event_queue_high_water, self._event_queue.qsize()
+        )
+
+    def _trace_event(self, event: GeckoSpaEvent) -> None:
+        """Mark a spa event in the trace, and the phases it starts or ends."""
+        self.tracer.instant(event.name, "spa", state=str(self.spa_state))
+        if event == GeckoSpaEvent.LOCATING_STARTED:
+            self.tracer.begin("locate", "spa")
+        elif event == GeckoSpaEvent.LOCATING_FINISHED:
+            self.tracer.end("locate")
+        elif event == GeckoSpaEvent.CONNECTION_STARTED:
+            self.tracer.begin("connect", "spa")
+        elif event == GeckoSpaEvent.CONNECTION_FINISHED:
+            self.tracer.end("connect")
+
+    def _record_ping(self, event: GeckoSpaEvent) -> None:
+        """Add a ping result to the statistics."""
+        # geckolib only reports whether a ping was answered, not how long it
+        # took, so loss is all there is to record
+        if event == GeckoSpaEvent.RUNNING_PING_MISSED:
+            self.ping_statistics.missed()
+        else:
+            self.ping_statistics.received()
+
+    @property
+    def event_counters(self) -> dict[str, Any]:
+        """Get the event pipeline counters."""
+        return {
+            "queue_depth": self._event_queue.qsize(),
+            "queue_high_water": self._event_queue_high_water,
+            "reload_events": self._reload_events,
+            "reload_passes": self._reload_passes,
+            "coalesce_ratio": (
+                self._reload_events / self._reload_passes
+                if self._reload_passes
+                else None
+            ),
+        }
+
+    @property
+    def reload_counters(self) -> dict[str, Any]:
+        """Get the reload counters."""
+        return {
+            "count": self._reload_count,
+            "total_seconds": self._reload_time_total,
+            "max_seconds": self._reload_time_max,
+            "mean_seconds": (
+                self._reload_time_total / self._reload_count
+                if self._reload_count
+                else None
+            ),
+        }
+
+    @property
+    def facade_ready_after(self) -> float | None:
+        """Get the seconds from starting until the facade was first ready."""
+        return self._facade_ready_after
+
+    @property
+    def state_history(self) -> list[tuple[float, str]]:
+        """Get the recent spa state transitions as (timestamp, state) pairs."""
+        return list(self._state_history)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Get the device information shared by all the spa entities."""
+        if self._device_info is None:
+            self._device_info = self._build_device_info()
+        return self._device_info
+
+    def _build_device_info(self) -> DeviceInfo:
+        """Build the device information for the spa."""
+        info = DeviceInfo()
+        info["identifiers"] = {(DOMAIN, self.unique_id)}
+        info["name"] = self.spa_name
+        info["manufacturer"] = "Gecko Alliance"
+        if self._can_use_facade and self.facade is not None:
+            spa = self.facade.spa
+            info["model"] = f"{spa.pack} {spa.version}"
+            info["sw_version"] = (
+                f"SpaPack:v{spa.revision} "
+                f"Config:{spa.config_version} "
+                f"Log:{spa.log_version}"
+            )
+            info["hw_version"] = (
+                f"EN:{spa.intouch_version_en} CO:{spa.intouch_version_co}"
+            )
+        return info
+
+    @property
+    def desired_platforms(self) -> list[str]:
+        """Get the platforms that should be loaded in the current state."""
+        if self._can_use_facade and self.facade is not None:
+            capable = self._facade_platforms()
+            return [platform for platform in PLATFORMS if platform in capable]
+        # Until the facade is ready, catalogued platforms are loaded with
+        # unavailable entities so they are there straight away
+        catalogued = self.catalog.platforms if self.catalog is not None else {}
+        return [
+            platform
+            for platform in PLATFORMS
+            if platform in (SENSOR, BUTTON) or platform in catalogued
+        ]
+
+    def _facade_platforms(self) -> set[str]:
+        """
+        Work out which platforms will have entities for the facade.
+
+        This follows the platforms' entity builders so that a platform with
+        nothing to add is never imported or forwarded. It may err on the side
+        of forwarding a platform that turns out to be empty, but never the
+        other way. Each reload asks again, so a platform whose capability
+        appears later is forwarded then.
+        """
+        facade = self.facade
+        capabilities = {
+            BINARY_SENSOR: True,
+            BUTTON: True,
+            SENSOR: True,
+            FAN: bool(facade.pumps or facade.blowers),
+            SWITCH: (
+                facade.eco_mode is not None
+                or facade.standby is not None
+                or facade.mrsteam.is_available
+                or facade.bainultra.is_available
+            ),
+            CLIMATE: facade.water_heater.is_available,
+            LIGHT: bool(facade.lights) or facade.inmix.is_available,
+            SELECT: (
+                facade.heatpump.is_available
+                or facade.ingrid.is_available
+                or facade.lockmode.is_available
+                or facade.keypad.backlight.is_available
+                or facade.inmix.is_available
+                or facade.water_care.is_available
+                or facade.bainultra.is_available
+            ),
+            WATER_HEATER: (
+                facade.water_heater.is_available or facade.mrsteam.is_available
+            ),
+            DATE: self.reminder_dispatcher is not None,
+            NUMBER: facade.mrsteam.is_available or facade.bainultra.is_available,
+        }
+        return {platform for platform, capable in capabilities.items() if capable}
 
     async def unload_platforms(self) -> bool:
         """Unload the platforms that were previously loaded."""
@@ -96,28 +480,221 @@ class GeckoSpaManager(GeckoAsyncSpaMan):
                 self.entry, self.platforms
             )
             self.platforms = []
+            self._platform_setups.clear()
+            self._entities.clear()
             return unloaded
         return True
 
     async def load_platforms(self) -> None:
-        """Load the appropriate platforms."""
-        platforms = [SENSOR, BUTTON]
-        if self._can_use_facade:
-            platforms = PLATFORMS
-        self.platforms = platforms
+        """Load the appropriate platforms that aren't already loaded."""
+        platforms = [
+            platform
+            for platform in self.desired_platforms
+            if platform not in self.platforms
+        ]
+        if not platforms:
+            return
+        self.platforms.extend(platforms)
 
         _LOGGER.debug("Load platforms %s", platforms)
-        await self.hass.config_entries.async_forward_entry_setups(self.entry, platforms)
+        with self.tracer.span("forward platforms", "events", platforms=platforms):
+            await self.hass.config_entries.async_forward_entry_setups(
+                self.entry, platforms
+            )
 
     def platform_loaded(self, platform: str) -> None:
         """Call when a platform has loaded."""
         if platform not in self.platforms:
             self.platforms.append(platform)
 
+    async def async_setup_platform(
+        self,
+        platform: str,
+        async_add_entities: AddEntitiesCallback,
+        builder: PlatformBuilder,
+    ) -> None:
+        """Set up a platform whose entities are produced by the builder."""
+        with self.tracer.span("async_setup_entry", f"platform {platform}"):
+            self._platform_setups[platform] = (async_add_entities, builder)
+            await self._async_reconcile_platform(platform)
+            self.platform_loaded(platform)
+
+    async def _async_reconcile_platform(self, platform: str) -> None:
+        """Add and remove entities so the platform matches the spa."""
+        async_add_entities, builder = self._platform_setups[platform]
+        with self.tracer.span("build entities", f"platform {platform}"):
+            desired = {entity.unique_id: entity for entity in builder(self, self.entry)}
+        if not self._can_use_facade and self.catalog is not None:
+            for unique_id, record in self.catalog.platforms.get(platform, {}).items():
+                if unique_id not in desired:
+                    desired[unique_id] = GeckoCatalogEntity(
+                        self, self.entry, unique_id, record
+                    )
+        loaded = self._entities.setdefault(platform, {})
+
+        # Entities whose geckolib object has changed (a stand-in, or one of an
+        # old facade) are removed and the new one added with the same unique
+        # id, so the registry keeps its entity id. The rest stay as they are
+        stale = [
+            entity
+            for unique_id, entity in loaded.items()
+            if unique_id not in desired
+            or desired[unique_id].source is not entity.source
+        ]
+        for entity in stale:
+            del loaded[entity.unique_id]
+            # Entities disabled in the registry were never added to HA
+            if entity.hass is not None:
+                await entity.async_remove()
+
+        added = [
+            entity for unique_id, entity in desired.items() if unique_id not in loaded
+        ]
+        for entity in added:
+            loaded[entity.unique_id] = entity
+        if added:
+            with self.tracer.span(
+                "add entities", f"platform {platform}", count=len(added)
+            ):
+                async_add_entities(added)
+
+        _LOGGER.debug(
+            "Reconciled %s: %d removed, %d added, %d kept",
+            platform,
+            len(stale),
+            len(added),
+            len(loaded) - len(added),
+        )
+
     async def reload(self) -> None:
-        """Reload the platforms."""
-        await self.unload_platforms()
-        await self.load_platforms()
+        """Reconcile the loaded platforms and entities with the spa."""
+        start = time.perf_counter()
+        with self.tracer.span("reload", "events"):
+            desired = self.desired_platforms
+            removed = [
+                platform for platform in self.platforms if platform not in desired
+            ]
+            if removed:
+                _LOGGER.debug("Unload platforms %s", removed)
+                with self.tracer.span("unload platforms", "events", platforms=removed):
+                    await self.hass.config_entries.async_unload_platforms(
+                        self.entry, removed
+                    )
+                for platform in removed:
+                    self.platforms.remove(platform)
+                    self._platform_setups.pop(platform, None)
+                    self._entities.pop(platform, None)
+
+            for platform in self.platforms:
+                if platform in self._platform_setups:
+                    await self._async_reconcile_platform(platform)
+
+            await self.load_platforms()
+            self.check_observer_leaks()
+            if self._can_use_facade and self.catalog is not None:
+                self.catalog.async_delay_save(self._catalog_data)
+
+        elapsed = time.perf_counter() - start
+        self._reload_count += 1
+        self._reload_time_total += elapsed
+        self._reload_time_max = max(self._reload_time_max, elapsed)
+        _LOGGER.debug("Reload took %.3fs", elapsed)
+        if self.tracer.enabled:
+            self.hass.async_create_background_task(
+                self.async_export_trace(), "Gecko trace export"
+            )
+
+    async def async_export_trace(self) -> None:
+        """Write the entry's trace file, replacing the last one."""
+        path = Path(
+            self.hass.config.path(
+                DOMAIN, TRACE_DIRECTORY, f"{self.entry.entry_id}.json"
+            )
+        )
+        await self.hass.async_add_executor_job(write_trace, path, self.tracer.data())
+        _LOGGER.debug("Trace written to %s", path)
+
+    async def async_load_catalog(self) -> None:
+        """Load the entity catalog for the spa."""
+        if self.catalog is not None:
+            await self.catalog.async_load()
+
+    async def async_save_catalog(self) -> None:
+        """Save the entity catalog for the spa now."""
+        if self.catalog is not None:
+            self._catalog_data()
+            await self.catalog.async_save()
+
+    def _catalog_data(self) -> dict[str, Any]:
+        """Refresh the catalog from the live entities and get the data to store."""
+        if self._can_use_facade:
+            self.catalog.update(self._entities)
+        return self.catalog.data
+
+    @property
+    def entities(self) -> list[GeckoEntityBase]:
+        """Get the entities currently loaded for the spa."""
+        return [
+            entity
+            for entities in self._entities.values()
+            for entity in entities.values()
+        ]
+
+    @property
+    def is_ready(self) -> bool:
+        """Determine if the facade is usable and all its platforms are set up."""
+        return self._can_use_facade and all(
+            platform in self._platform_setups for platform in self.desired_platforms
+        )
+
+    def track_observer(self, entity: GeckoEntityBase, observable: Any) -> None:
+        """Record that an entity is watching a geckolib observable."""
+        self._observed_objects.add(observable)
+        self._observing_entities.add(entity)
+
+    def observer_report(self) -> dict[str, dict[str, int]]:
+        """
+        Report the live observer counts on the watched geckolib objects.
+
+        They are reported by tag, and the objects of an old facade that are
+        still alive are counted in with the new ones that have the same tag.
+        """
+        live = set(self.entities)
+        report: dict[str, dict[str, int]] = {}
+        for observable in list(self._observed_objects):
+            observers = getattr(observable, "_observers", [])
+            entities = [
+                observer.__self__
+                for observer in observers
+                if getattr(observer, "__self__", None) in self._observing_entities
+            ]
+            tag = getattr(observable, "key", None) or getattr(
+                observable, "tag", type(observable).__name__
+            )
+            counts = report.setdefault(tag, {"observers": 0, "entities": 0, "dead": 0})
+            counts["observers"] += len(observers)
+            counts["entities"] += len(entities)
+            counts["dead"] += sum(1 for entity in entities if entity not in live)
+        return report
+
+    def check_observer_leaks(self) -> int:
+        """Warn if removed entities are still watching geckolib objects."""
+        report = self.observer_report()
+        _LOGGER.debug("Observer counts %s", report)
+        leaks = {name: counts for name, counts in report.items() if counts["dead"]}
+        if leaks:
+            _LOGGER.warning("Removed entities are still observing %s", leaks)
+        return sum(counts["dead"] for counts in leaks.values())
+
+    def state_filter(
+        self, deadband_key: str, min_interval_key: str, reader: Callable[[], Any]
+    ) -> GeckoStateFilter | None:
+        """Build a state filter from the options, if they ask for one."""
+        deadband = self.entry.options.get(deadband_key, 0)
+        min_interval = self.entry.options.get(min_interval_key, 0)
+        if not deadband and not min_interval:
+            return None
+        return GeckoStateFilter(deadband, min_interval, reader)
 
     @property
     def show_ping_sensor(self) -> bool:
@@ -125,3 +702,24 @@ class GeckoSpaManager(GeckoAsyncSpaMan):
         if SHOW_PING_KEY not in self.entry.options:
             return False
         return self.entry.options[SHOW_PING_KEY]
+
+
+def async_hand_over(
+    hass: HomeAssistant, client_id: str, spaman: GeckoSpaManager
+) -> None:
+    """Keep a manager started by the config flow for async_setup_entry."""
+    handovers: dict[str, GeckoSpaManager] = hass.data.setdefault(HANDOVER_DATA, {})
+    handovers[client_id] = spaman
+
+    async def _async_expire(_now: datetime) -> None:
+        if handovers.get(client_id) is spaman:
+            _LOGGER.debug("Manager for %s was never set up, close it", client_id)
+            handovers.pop(client_id)
+            await spaman.__aexit__()
+
+    async_call_later(hass, HANDOVER_TIMEOUT, _async_expire)
+
+
+def take_over(hass: HomeAssistant, client_id: str) -> GeckoSpaManager | None:
+    """Take the manager the config flow started for a client id, if any."""
+    return hass.data.get(HANDOVER_DATA, {}).pop(client_id, None)
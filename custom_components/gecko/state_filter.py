@@ -0,0 +1,84 @@
+"""GeckoStateFilter class drops state writes for insignificant sensor changes."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from asyncio import TimerHandle
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+class GeckoStateFilter:
+    """
+    Deadband and minimum interval filter for a sensor's state writes.
+
+    A change within the deadband of the last written value is dropped, and
+    a change that comes too soon after the last write is held back until the
+    interval has passed, when the sensor is asked to write whatever its value
+    is by then. The filters only apply from one number to another, so the
+    sensor becoming unavailable or showing text is always written straight
+    away.
+    """
+
+    def __init__(
+        self, deadband: float, min_interval: float, reader: Callable[[], Any]
+    ) -> None:
+        """Initialize the filter."""
+        self._deadband = deadband
+        self._min_interval = min_interval
+        self._reader = reader
+        self._written = False
+        self._last_value: Any = None
+        self._last_time = 0.0
+        self._handle: TimerHandle | None = None
+
+        self.passed = 0
+        self.suppressed_deadband = 0
+        self.suppressed_interval = 0
+
+    def allow(self, hass: HomeAssistant, on_due: Callable[[], None]) -> bool:
+        """Determine if the current value should be written now."""
+        value = self._reader()
+        if self._written and _is_number(value) and _is_number(self._last_value):
+            if abs(value - self._last_value) < self._deadband:
+                self.suppressed_deadband += 1
+                return False
+            wait = self._last_time + self._min_interval - time.monotonic()
+            if wait > 0:
+                self.suppressed_interval += 1
+                if self._handle is None:
+                    self._handle = hass.loop.call_later(wait, self._due, on_due)
+                return False
+        self._written = True
+        self._last_value = value
+        self._last_time = time.monotonic()
+        self.passed += 1
+        return True
+
+    def _due(self, on_due: Callable[[], None]) -> None:
+        self._handle = None
+        on_due()
+
+    def cancel(self) -> None:
+        """Cancel any held back write."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the filter counters."""
+        return {
+            "passed": self.passed,
+            "suppressed_deadband": self.suppressed_deadband,
+            "suppressed_interval": self.suppressed_interval,
+            "suppressed": self.suppressed_deadband + self.suppressed_interval,
+        }
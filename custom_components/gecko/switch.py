@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, SWITCH
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 
 if TYPE_CHECKING:
     from .spa_manager import GeckoSpaManager
@@ -20,8 +20,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    if spaman.facade is not None:
-        entities = []
+    await spaman.async_setup_platform(SWITCH, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: "GeckoSpaManager", entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the switch entities for the spa."""
+    entities: list = []
+    if spaman.can_use_facade and spaman.facade is not None:
         if spaman.facade.eco_mode is not None:
             entities.append(
                 GeckoBinarySwitch(
@@ -48,28 +55,32 @@ async def async_setup_entry(
                     for switch in spaman.facade.bainultra.switches
                 ]
             )
-
-        async_add_entities(entities)
-    spaman.platform_loaded(SWITCH)
+    return entities
 
 
 class GeckoBinarySwitch(GeckoEntity, SwitchEntity):
     """Gecko switch class."""
 
+    _attr_icon = "mdi:toggle-switch"
+
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on the switch."""
-        await self._automation_entity.async_turn_on()
+        await self._async_send_optimistic(
+            {"is_on": (True, self._actual_is_on)},
+            self._automation_entity.async_turn_on,
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off the switch."""
-        await self._automation_entity.async_turn_off()
+        await self._async_send_optimistic(
+            {"is_on": (False, self._actual_is_on)},
+            self._automation_entity.async_turn_off,
+        )
 
-    @property
-    def icon(self) -> str:
-        """Return the icon of this switch."""
-        return "mdi:toggle-switch"
+    def _actual_is_on(self) -> bool:
+        return self._automation_entity.is_on
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        return self._automation_entity.is_on
+        return self._optimistic_value("is_on", self._automation_entity.is_on)
@@ -0,0 +1,117 @@
+"""GeckoTracer class records a spa's setup and reloads as a Chrome trace."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from .const import TRACE_MAX_EVENTS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class GeckoTracer:
+    """
+    Spans and instants in the Chrome trace event format.
+
+    Each lane becomes a thread in the trace viewer, so work that overlaps,
+    like the platforms being set up together, is laid out side by side. Only
+    the most recent events are kept, so it can be left on. When it is off,
+    every method returns straight away.
+    """
+
+    def __init__(self, name: str = "", *, enabled: bool = False) -> None:
+        """Initialize the tracer."""
+        self.name = name
+        self.enabled = enabled
+        self._origin = time.perf_counter()
+        self._events: deque[dict[str, Any]] = deque(maxlen=TRACE_MAX_EVENTS)
+        self._lanes: dict[str, int] = {}
+        self._open: dict[str, tuple[float, str]] = {}
+
+    def _now(self) -> float:
+        """Get the microseconds since the tracer started."""
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def _lane(self, lane: str) -> int:
+        return self._lanes.setdefault(lane, len(self._lanes) + 1)
+
+    def _complete(self, name: str, lane: str, start: float, args: dict) -> None:
+        self._events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now() - start,
+                "pid": 1,
+                "tid": self._lane(lane),
+                "args": args,
+            }
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, lane: str = "setup", **args: Any) -> Iterator[None]:
+        """Record the time spent in the block, which may await."""
+        if not self.enabled:
+            yield
+            return
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._complete(name, lane, start, args)
+
+    def begin(self, name: str, lane: str) -> None:
+        """Start a span that is ended by name from somewhere else."""
+        if self.enabled:
+            self._open[name] = (self._now(), lane)
+
+    def end(self, name: str, **args: Any) -> None:
+        """End a span started with begin, if there is one."""
+        if self.enabled and (opened := self._open.pop(name, None)) is not None:
+            self._complete(name, opened[1], opened[0], args)
+
+    def instant(self, name: str, lane: str, **args: Any) -> None:
+        """Record a point in time."""
+        if self.enabled:
+            self._events.append(
+                {
+                    "name": name,
+                    "ph": "i",
+                    "s": "t",
+                    "ts": self._now(),
+                    "pid": 1,
+                    "tid": self._lane(lane),
+                    "args": args,
+                }
+            )
+
+    def data(self) -> dict[str, Any]:
+        """Get the trace, with the process and lanes named."""
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.name}}
+        ] + [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": lane},
+            }
+            for lane, tid in self._lanes.items()
+        ]
+        return {"traceEvents": metadata + list(self._events), "displayTimeUnit": "ms"}
+
+
+def write_trace(path: Path, data: dict[str, Any]) -> None:
+    """Write a trace file, replacing it in one go. This blocks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".tmp")
+    with partial.open("w", encoding="utf-8") as file:
+        json.dump(data, file, default=str)
+    partial.replace(path)
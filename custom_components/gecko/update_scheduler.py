@@ -0,0 +1,86 @@
+"""GeckoUpdateScheduler class batches entity state writes for a spa."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import UPDATE_FRAME_TIME
+
+if TYPE_CHECKING:
+    from asyncio import TimerHandle
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeckoUpdateScheduler:
+    """
+    Collect entities that have changed and write their state once per frame.
+
+    A single status packet from the spa can notify dozens of observers, so
+    rather than each one scheduling its own state write, they mark themselves
+    dirty here and the whole batch is flushed at the end of the frame.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant | None, frame_time: float = UPDATE_FRAME_TIME
+    ) -> None:
+        """Initialize the update scheduler."""
+        self.hass: HomeAssistant | None = hass
+        self._frame_time = frame_time
+        self._dirty: dict[Entity, None] = {}
+        self._handle: TimerHandle | None = None
+
+        self.changes_seen = 0
+        self.state_writes = 0
+        self.flushes = 0
+        self.flush_time = 0.0
+
+    def schedule(self, entity: Entity) -> None:
+        """Mark an entity as needing a state write."""
+        self.changes_seen += 1
+        self._dirty[entity] = None
+        if self._handle is not None or self.hass is None:
+            return
+        if self._frame_time > 0:
+            self._handle = self.hass.loop.call_later(self._frame_time, self._flush)
+        else:
+            self._handle = self.hass.loop.call_soon(self._flush)
+
+    @callback
+    def _flush(self) -> None:
+        """Write the state of all the dirty entities."""
+        self._handle = None
+        dirty, self._dirty = self._dirty, {}
+        self.flushes += 1
+        start = time.perf_counter()
+        for entity in dirty:
+            if entity.hass is None:
+                continue
+            entity.async_write_ha_state()
+            self.state_writes += 1
+        self.flush_time += time.perf_counter() - start
+
+    def cancel(self) -> None:
+        """Cancel any pending flush and forget the dirty entities."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._dirty.clear()
+
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Get the scheduler counters."""
+        return {
+            "changes_seen": self.changes_seen,
+            "state_writes": self.state_writes,
+            "flushes": self.flushes,
+            "writes_saved": self.changes_seen - self.state_writes,
+            "flush_seconds": self.flush_time,
+        }
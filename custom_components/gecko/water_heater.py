@@ -1,9 +1,8 @@
 """Water heater platform for Gecko."""
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from geckolib import GeckoAsyncFacade, GeckoWaterHeaterAbstract
 from homeassistant.components.water_heater import (
     WaterHeaterEntity,
     WaterHeaterEntityFeature,
@@ -13,9 +12,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, WATER_HEATER
-from .entity import GeckoEntity
+from .entity import GeckoEntity, GeckoEntityBase
 from .spa_manager import GeckoSpaManager
 
+if TYPE_CHECKING:
+    from geckolib import GeckoAsyncFacade, GeckoWaterHeaterAbstract
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -24,9 +26,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up climate platform."""
     spaman: GeckoSpaManager = hass.data[DOMAIN][entry.entry_id]
-    if spaman.facade is not None:
+    await spaman.async_setup_platform(WATER_HEATER, async_add_entities, _build_entities)
+
+
+def _build_entities(
+    spaman: GeckoSpaManager, entry: ConfigEntry
+) -> list[GeckoEntityBase]:
+    """Build the water heater entities for the spa."""
+    water_heaters: list = []
+    if spaman.can_use_facade and spaman.facade is not None:
         facade: GeckoAsyncFacade = spaman.facade
-        water_heaters = []
 
         if spaman.facade.water_heater.is_available:
             water_heaters.append(
@@ -38,10 +47,7 @@ async def async_setup_entry(
             )
         if spaman.facade.mrsteam.is_available:
             water_heaters.append(GeckoHAWaterHeater(spaman, entry, facade.mrsteam))
-
-        async_add_entities(water_heaters)
-
-    spaman.platform_loaded(WATER_HEATER)
+    return water_heaters
 
 
 class GeckoHAWaterHeater(GeckoEntity, WaterHeaterEntity):
@@ -51,19 +57,15 @@ class GeckoHAWaterHeater(GeckoEntity, WaterHeaterEntity):
         self,
         spaman: GeckoSpaManager,
         config_entry: ConfigEntry,
-        automation_entity: GeckoWaterHeaterAbstract,
+        automation_entity: "GeckoWaterHeaterAbstract",
     ) -> None:
         """Initialize Gecko climate entity."""
         self._attr_supported_features = WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        self._attr_icon = (
+            "mdi:steam" if spaman.facade.mrsteam.is_available else "mdi:hot-tub"
+        )
         super().__init__(spaman, config_entry, automation_entity)
 
-    @property
-    def icon(self) -> str:
-        """Return the icon of the sensor."""
-        if self.spaman.facade.mrsteam.is_available:
-            return "mdi:steam"
-        return "mdi:hot-tub"
-
     @property
     def current_operation(self) -> str:
         """The current operation."""
@@ -82,7 +84,9 @@ class GeckoHAWaterHeater(GeckoEntity, WaterHeaterEntity):
     @property
     def target_temperature(self) -> float:
         """Get the current target temperature."""
-        return self._automation_entity.target_temperature
+        return self._optimistic_value(
+            "target_temperature", self._automation_entity.target_temperature
+        )
 
     @property
     def min_temp(self) -> float:
@@ -96,10 +100,16 @@ class GeckoHAWaterHeater(GeckoEntity, WaterHeaterEntity):
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set the target temperature asyncronously."""
-        await self._automation_entity.async_set_target_temperature(
-            kwargs["temperature"]
+        temperature = kwargs["temperature"]
+        await self._async_send_optimistic(
+            {"target_temperature": (temperature, self._actual_target_temperature)},
+            self._automation_entity.async_set_target_temperature,
+            temperature,
         )
 
+    def _actual_target_temperature(self) -> float:
+        return self._automation_entity.target_temperature
+
     def _on_change(self, _sender: Any, _old_value: Any, _new_value: Any) -> None:
         self._attr_available = self._automation_entity.is_available
         return super()._on_change(_sender, _old_value, _new_value)
@@ -0,0 +1,163 @@
+"""
+End to end benchmarks for the Gecko integration against a simulated spa.
+
+Reports
+    setup   time from async_setup_entry to every entity having a state
+    churn   changes seen and state writes per second while registers churn
+    reload  latency of a reconciliation pass and of a full entry reload
+
+Usage
+
+    python scripts/benchmark.py --snapshot <file> [--json results.json]
+
+Requires the packages in requirements.txt and the geckolib version from the
+manifest to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bench_harness import (
+    async_add_spa,
+    async_home_assistant,
+    async_wait_ready,
+    spa_manager,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from spa_simulator import SimulatedSpa
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, HomeAssistant
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Summarise timing samples."""
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "runs": len(samples),
+    }
+
+
+async def _bench_setup(
+    hass: HomeAssistant, entry: ConfigEntry, runs: int
+) -> dict[str, float]:
+    """Time async_setup_entry until every entity is ready."""
+    samples = []
+    for _ in range(runs):
+        await hass.config_entries.async_unload(entry.entry_id)
+        start = time.perf_counter()
+        await hass.config_entries.async_setup(entry.entry_id)
+        await async_wait_ready(hass, entry)
+        samples.append(time.perf_counter() - start)
+    return _summary(samples)
+
+
+async def _bench_churn(
+    hass: HomeAssistant, entry: ConfigEntry, spa: SimulatedSpa, args: argparse.Namespace
+) -> dict[str, float]:
+    """Measure state writes while the simulator churns registers."""
+    spaman = spa_manager(hass, entry)
+    entity_ids = {entity.entity_id for entity in spaman.entities}
+    state_changes = 0
+
+    def _on_state_changed(event: Event) -> None:
+        nonlocal state_changes
+        if event.data["entity_id"] in entity_ids:
+            state_changes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _on_state_changed)
+    before = spaman.update_scheduler.counters
+    sent_before = spa.changes_sent
+    spa.start_churn(args.churn_rate)
+    start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    spa.start_churn(0)
+    elapsed = time.perf_counter() - start
+    after = spaman.update_scheduler.counters
+    unsub()
+
+    return {
+        "churn_rate": args.churn_rate,
+        "seconds": elapsed,
+        "register_changes_per_second": (spa.changes_sent - sent_before) / elapsed,
+        "changes_seen_per_second": (after["changes_seen"] - before["changes_seen"])
+        / elapsed,
+        "state_writes_per_second": (after["state_writes"] - before["state_writes"])
+        / elapsed,
+        "state_changed_events_per_second": state_changes / elapsed,
+    }
+
+
+async def _bench_reload(
+    hass: HomeAssistant, entry: ConfigEntry, runs: int
+) -> dict[str, Any]:
+    """Time reconciliation passes and full entry reloads."""
+    reconcile = []
+    for _ in range(runs):
+        spaman = spa_manager(hass, entry)
+        start = time.perf_counter()
+        await spaman.reload()
+        reconcile.append(time.perf_counter() - start)
+
+    full = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await hass.config_entries.async_reload(entry.entry_id)
+        await async_wait_ready(hass, entry)
+        full.append(time.perf_counter() - start)
+
+    return {"reconcile": _summary(reconcile), "entry_reload": _summary(full)}
+
+
+async def _async_main(args: argparse.Namespace) -> dict[str, Any]:
+    async with (
+        SimulatedSpa(args.snapshot, host=args.host, name=args.name) as spa,
+        async_home_assistant() as hass,
+    ):
+        entry = await async_add_spa(hass, args.host, args.name)
+        await async_wait_ready(hass, entry)
+        results: dict[str, Any] = {
+            "entities": len(spa_manager(hass, entry).entities),
+        }
+        results["setup"] = await _bench_setup(hass, entry, args.runs)
+        results["churn"] = await _bench_churn(hass, entry, spa, args)
+        results["reload"] = await _bench_reload(hass, entry, args.runs)
+        return results
+
+
+def main() -> None:
+    """Run the benchmarks and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", required=True, help="Snapshot file to load")
+    parser.add_argument("--host", default="127.0.0.1", help="Simulator address")
+    parser.add_argument("--name", default="Simulated Spa", help="Spa name")
+    parser.add_argument("--runs", type=int, default=5, help="Repeats per timing")
+    parser.add_argument(
+        "--churn-rate", type=float, default=50.0, help="Register changes per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds of churn to measure"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(_async_main(args))
+    report = json.dumps(results, indent=2)
+    sys.stdout.write(f"{report}\n")
+    if args.json is not None:
+        args.json.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Import time benchmark for the Gecko integration.
+
+Each module is imported in a fresh interpreter with python -X importtime and
+the cumulative time for it is taken from the report, along with the slowest
+modules it pulled in and whether geckolib was among them. Home Assistant
+imports the integration and its platforms in its executor, so this is the
+cost of that import, not time spent on the event loop.
+
+Usage
+
+    python scripts/import_benchmark.py [--runs 5] [--budget-ms 150]
+        [--module custom_components.gecko ...] [--json results.json]
+
+Exits with a non-zero status if the median import time of any module exceeds
+the budget. Requires the packages in requirements.txt to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = [
+    "custom_components.gecko",
+    "custom_components.gecko.config_flow",
+    "custom_components.gecko.spa_manager",
+]
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter, returning (self, cumulative) us."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _bench_module(module: str, runs: int, top: int) -> dict[str, Any]:
+    """Time a module over several runs."""
+    samples = []
+    last: dict[str, tuple[int, int]] = {}
+    for _ in range(runs):
+        last = _import_times(module)
+        samples.append(last[module][1] / 1000)
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "runs": runs,
+        "imports_geckolib": "geckolib" in last,
+        "slowest_self_ms": {name: times[0] / 1000 for name, times in slowest},
+    }
+
+
+def main() -> None:
+    """Run the import benchmark and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--module", nargs="+", default=DEFAULT_MODULES, help="Modules to import"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument(
+        "--budget-ms", type=float, default=150.0, help="Median import time budget"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = {
+        module: _bench_module(module, args.runs, args.top) for module in args.module
+    }
+    report = json.dumps(results, indent=2)
+    sys.stdout.write(f"{report}\n")
+    if args.json is not None:
+        args.json.write_text(report)
+
+    over = [
+        module
+        for module, result in results.items()
+        if result["median_ms"] > args.budget_ms
+    ]
+    if over:
+        sys.stderr.write(f"Over the {args.budget_ms}ms budget: {', '.join(over)}\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
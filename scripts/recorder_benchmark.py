@@ -0,0 +1,186 @@
+"""
+Recorder cost benchmark for the Gecko integration against a simulated spa.
+
+A simulated spa is added to a Home Assistant with the recorder writing to a
+SQLite database, its registers are churned, and the rows the recorder wrote
+for the spa's entities are counted. This is done twice
+
+    before  every entity enabled, including those disabled by default, and
+            no state filters, which is how every entity used to be recorded
+    after   the integration's defaults with the given options
+
+and for each reports the states and state attributes rows per hour, the
+busiest entities, and how many entities have a state class and so get long
+term statistics.
+
+Usage
+
+    python scripts/recorder_benchmark.py --snapshot <file> [--duration 60]
+        [--options '{"temperature_deadband": 0.5}'] [--json results.json]
+
+Requires the packages in requirements.txt and the geckolib version from the
+manifest to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bench_harness import (
+    async_add_spa,
+    async_home_assistant,
+    async_wait_ready,
+)
+from homeassistant.components.recorder import get_instance
+from homeassistant.helpers import entity_registry as er
+from spa_simulator import SimulatedSpa
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+RECORDER_CONFIG = "recorder:\n  commit_interval: 1\n"
+DEFAULT_OPTIONS = {
+    "temperature_deadband": 0.5,
+    "temperature_min_interval": 60,
+    "diagnostic_min_interval": 300,
+}
+
+
+def _count_rows(database: str, entity_ids: list[str], since: float) -> dict[str, Any]:
+    """Count the rows written for the entities since a timestamp."""
+    placeholders = ",".join("?" * len(entity_ids))
+    recent = (
+        "FROM states JOIN states_meta ON states.metadata_id = states_meta.metadata_id "
+        f"WHERE states_meta.entity_id IN ({placeholders}) "
+        "AND states.last_updated_ts >= ?"
+    )
+    with contextlib.closing(sqlite3.connect(database)) as connection:
+        per_entity = dict(
+            connection.execute(
+                f"SELECT states_meta.entity_id, COUNT(*) {recent} "
+                "GROUP BY states_meta.entity_id",
+                (*entity_ids, since),
+            ).fetchall()
+        )
+        # Attribute rows are shared, so only count those first used recently
+        (attributes,) = connection.execute(
+            f"SELECT COUNT(DISTINCT states.attributes_id) {recent} "  # noqa: S608
+            "AND states.attributes_id NOT IN (SELECT attributes_id FROM states "
+            "WHERE last_updated_ts < ? AND attributes_id IS NOT NULL)",
+            (*entity_ids, since, since),
+        ).fetchone()
+    return {"states": per_entity, "state_attributes": attributes}
+
+
+async def _async_enable_all(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Enable the entities that are disabled by default, and reload."""
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(registry_entry.entity_id, disabled_by=None)
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_phase(args: argparse.Namespace, *, baseline: bool) -> dict[str, Any]:
+    """Measure the recorder rows for one configuration."""
+    async with (
+        SimulatedSpa(args.snapshot, host=args.host, name=args.name) as spa,
+        async_home_assistant(RECORDER_CONFIG) as hass,
+    ):
+        entry = await async_add_spa(hass, args.host, args.name)
+        await async_wait_ready(hass, entry)
+        if baseline:
+            await _async_enable_all(hass, entry)
+        else:
+            hass.config_entries.async_update_entry(entry, options=args.options)
+        # Either way the entry reloads, so wait for it to settle again
+        await hass.async_block_till_done()
+        await async_wait_ready(hass, entry)
+
+        entity_ids = [
+            registry_entry.entity_id
+            for registry_entry in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+            if registry_entry.disabled_by is None
+        ]
+        recorder = get_instance(hass)
+        await recorder.async_block_till_done()
+
+        since = time.time()
+        spa.start_churn(args.churn_rate)
+        await asyncio.sleep(args.duration)
+        spa.start_churn(0)
+        elapsed = time.time() - since
+        await recorder.async_block_till_done()
+
+        rows = await hass.async_add_executor_job(
+            _count_rows, hass.config.path("home-assistant_v2.db"), entity_ids, since
+        )
+        with_state_class = sum(
+            1
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id)) is not None
+            and "state_class" in state.attributes
+        )
+
+    per_hour = 3600 / elapsed
+    busiest = sorted(rows["states"].items(), key=lambda item: item[1], reverse=True)
+    return {
+        "entities": len(entity_ids),
+        "with_state_class": with_state_class,
+        "states_rows_per_hour": sum(rows["states"].values()) * per_hour,
+        "state_attributes_rows_per_hour": rows["state_attributes"] * per_hour,
+        "busiest_per_hour": {
+            entity_id: count * per_hour for entity_id, count in busiest[: args.top]
+        },
+    }
+
+
+def main() -> None:
+    """Run the recorder benchmark and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", required=True, help="Snapshot file to load")
+    parser.add_argument("--host", default="127.0.0.1", help="Simulator address")
+    parser.add_argument("--name", default="Simulated Spa", help="Spa name")
+    parser.add_argument(
+        "--churn-rate", type=float, default=5.0, help="Register changes per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="Seconds to measure each phase"
+    )
+    parser.add_argument(
+        "--options",
+        type=json.loads,
+        default=DEFAULT_OPTIONS,
+        help="Entry options for the after phase, as JSON",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Busiest entities to list")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    before = asyncio.run(_async_phase(args, baseline=True))
+    after = asyncio.run(_async_phase(args, baseline=False))
+    results = {
+        "before": before,
+        "after": after,
+        "states_rows_saved": 1
+        - after["states_rows_per_hour"] / max(before["states_rows_per_hour"], 1),
+    }
+    report = json.dumps(results, indent=2)
+    sys.stdout.write(f"{report}\n")
+    if args.json is not None:
+        args.json.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
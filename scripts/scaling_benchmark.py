@@ -0,0 +1,187 @@
+"""
+Multi-spa scaling benchmark for the Gecko integration.
+
+For each spa count, a fresh Home Assistant is started and that many simulated
+spas are added through the config flow. The simulators run in a separate
+process so that only Home Assistant is measured. Once every spa is ready, the
+simulators churn their registers while this records
+
+    setup       seconds until every spa had all of its entities ready
+    loop lag    how late a 10ms timer fires (median, p95 and max)
+    cpu         process CPU seconds per wall second
+    rss         resident memory before and after adding the spas
+    tasks       asyncio tasks, in total and per spa
+    per spa     the integration's resource counters for each entry
+
+Usage
+
+    python scripts/scaling_benchmark.py --snapshot <file> [--spas 1 10 50]
+        [--json results.json]
+
+Requires the packages in requirements.txt and the geckolib version from the
+manifest to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bench_harness import (
+    async_add_spa,
+    async_home_assistant,
+    async_wait_ready,
+    spa_manager,
+)
+from spa_simulator import spa_host
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+SIMULATOR = Path(__file__).resolve().parent / "spa_simulator.py"
+LAG_INTERVAL = 0.01
+
+
+def _rss_bytes() -> int:
+    """Get the resident set size of this process."""
+    statm = Path("/proc/self/statm").read_text().split()
+    return int(statm[1]) * 4096
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Get a percentile from a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def _async_measure_lag(samples: list[float]) -> None:
+    """Record how late a short timer fires until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _async_start_simulators(
+    args: argparse.Namespace, count: int
+) -> asyncio.subprocess.Process:
+    """Start the simulators in their own process and wait for them all."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SIMULATOR),
+        "--snapshot",
+        args.snapshot,
+        "--count",
+        str(count),
+        "--host",
+        spa_host(0),
+        "--name",
+        args.name,
+        "--churn-rate",
+        str(args.churn_rate),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert process.stdout is not None  # noqa: S101
+    for _ in range(count):
+        await process.stdout.readline()
+    return process
+
+
+async def _async_run(args: argparse.Namespace, count: int) -> dict[str, Any]:
+    """Benchmark one spa count."""
+    simulators = await _async_start_simulators(args, count)
+    try:
+        async with async_home_assistant() as hass:
+            return await _async_measure(hass, args, count)
+    finally:
+        simulators.terminate()
+        await simulators.wait()
+
+
+async def _async_measure(
+    hass: HomeAssistant, args: argparse.Namespace, count: int
+) -> dict[str, Any]:
+    """Add the spas, then measure Home Assistant while they churn."""
+    rss_before = _rss_bytes()
+    tasks_before = len(asyncio.all_tasks())
+
+    start = time.perf_counter()
+    # The simulator only numbers the names when there is more than one spa
+    entries = [
+        await async_add_spa(
+            hass, spa_host(index), args.name if count == 1 else f"{args.name} {index}"
+        )
+        for index in range(count)
+    ]
+    await asyncio.gather(*(async_wait_ready(hass, entry) for entry in entries))
+    setup = time.perf_counter() - start
+
+    lag: list[float] = []
+    sampler = asyncio.create_task(_async_measure_lag(lag))
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+    sampler.cancel()
+
+    tasks = len(asyncio.all_tasks()) - tasks_before
+    rss_after = _rss_bytes()
+    per_spa = {
+        entry.title: spa_manager(hass, entry).resource_counters for entry in entries
+    }
+    return {
+        "spas": count,
+        "setup_seconds": setup,
+        "loop_lag": {
+            "median": statistics.median(lag),
+            "p95": _percentile(lag, 0.95),
+            "max": max(lag),
+            "samples": len(lag),
+        },
+        "cpu_per_second": cpu,
+        "rss_bytes": {
+            "before": rss_before,
+            "after": rss_after,
+            "per_spa": (rss_after - rss_before) / count,
+        },
+        "tasks": {"total": tasks, "per_spa": tasks / count},
+        "entities_per_spa": statistics.mean(
+            counters["entities"] for counters in per_spa.values()
+        ),
+        "per_spa": per_spa,
+    }
+
+
+def main() -> None:
+    """Run the scaling benchmark and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", required=True, help="Snapshot file to load")
+    parser.add_argument("--name", default="Simulated Spa", help="Spa name prefix")
+    parser.add_argument(
+        "--spas", type=int, nargs="+", default=[1, 10, 50], help="Spa counts to run"
+    )
+    parser.add_argument(
+        "--churn-rate", type=float, default=5.0, help="Register changes per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="Seconds to measure each count"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = [asyncio.run(_async_run(args, count)) for count in args.spas]
+    report = json.dumps(results, indent=2)
+    sys.stdout.write(f"{report}\n")
+    if args.json is not None:
+        args.json.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Local UDP spa simulator for exercising the Gecko integration without a spa.
+
+This wraps the in.touch2 simulator that ships with geckolib so that it can be
+bound to a specific local address, given its own name and identifier, and have
+its registers churned at a configurable rate. The snapshot can be any file
+geckolib can parse, or a snapshot file written by the integration's Snapshot
+button, compressed or not.
+
+Run standalone with
+
+    python scripts/spa_simulator.py --snapshot <file> [--churn-rate 20] [--count 10]
+
+and then add the spa to Home Assistant using the address it reports. With
+--count, each spa gets its own loopback address, name and identifier.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gzip
+import logging
+import random
+import sys
+from pathlib import Path
+from socket import AF_INET, SO_BROADCAST, SO_REUSEADDR, SOCK_DGRAM, SOL_SOCKET, socket
+from typing import Any, Self
+
+from geckolib.driver import GeckoHelloProtocolHandler
+from geckolib.driver.accessor import GeckoBoolStructAccessor
+from geckolib.driver.async_udp_protocol import GeckoAsyncUdpProtocol
+from geckolib.utils import simulator
+from geckolib.utils.snapshot import GeckoSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+SPA_PORT = 10022
+
+
+def spa_host(index: int) -> str:
+    """Get a distinct loopback address for a simulator index."""
+    return f"127.0.{1 + index // 250}.{1 + index % 250}"
+
+
+def spa_identifier(index: int) -> bytes:
+    """Build a distinct spa identifier for a simulator index."""
+    octets = ":".join(f"{b:02X}" for b in index.to_bytes(6, "big"))
+    return f"SPA{octets}".encode("ascii")
+
+
+def load_snapshot(path: str) -> GeckoSnapshot:
+    """
+    Load the one snapshot in a file.
+
+    The Snapshot button's files, compressed or not, hold the snapshot on a
+    SNAPSHOT line that geckolib doesn't recognise, so that is unwrapped here.
+    Anything else is left to geckolib.
+    """
+    opener = gzip.open if path.endswith(".gz") else Path.open
+    with opener(Path(path), "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("SNAPSHOT ========{"):
+                return GeckoSnapshot.parse_json(
+                    line.strip().removeprefix("SNAPSHOT ").strip("=")
+                )
+    snapshots = GeckoSnapshot.parse_log_file(path)
+    if len(snapshots) != 1:
+        msg = f"{path} holds {len(snapshots)} snapshots, not one"
+        raise ValueError(msg)
+    return snapshots[0]
+
+
+class SimulatedSpa(simulator.GeckoSimulator):
+    """An in.touch2 simulator bound to one address with optional churn."""
+
+    def __init__(
+        self,
+        snapshot: str,
+        *,
+        host: str = "127.0.0.1",
+        name: str = "Simulated Spa",
+        identifier: bytes = simulator.SPA_IDENTIFIER,
+        churn_rate: float = 0.0,
+    ) -> None:
+        """Initialize the simulated spa."""
+        super().__init__()
+        self.snapshot_path = snapshot
+        self.host = host
+        self.spa_name = name
+        self.identifier = identifier
+        self.churn_rate = churn_rate
+        self.changes_sent = 0
+
+    def run_async_loop(self) -> None:
+        """
+        Leave the console's event loop alone.
+
+        The base class starts a thread for its console that runs its own event
+        loop and enters the simulator from there. This spa is entered from the
+        caller's loop instead, so the thread returns straight away.
+        """
+
+    async def __aenter__(self) -> Self:
+        """Load the snapshot and start serving the spa."""
+        await super().__aenter__()
+        snapshot = await asyncio.to_thread(load_snapshot, self.snapshot_path)
+        # The base class reports on the load to its console, which is stdout,
+        # and the benchmarks write their results there
+        with contextlib.redirect_stdout(sys.stderr):
+            await self.set_snapshot(snapshot)
+        await self.do_start("")
+        self.start_churn(self.churn_rate)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop serving the spa."""
+        await super().__aexit__(*exc_info)
+        await self.gather()
+
+    @property
+    def identifier_as_string(self) -> str:
+        """Get the identifier as the integration stores it."""
+        return self.identifier.decode("ascii")
+
+    def start_churn(self, churn_rate: float) -> None:
+        """Start (or restart) churning registers at the given rate."""
+        self.cancel_key_tasks("CHURN")
+        self.churn_rate = churn_rate
+        if churn_rate > 0:
+            self.add_task(self._churn(), "Register churn", "CHURN")
+
+    async def do_start(self, _args: str) -> None:
+        """Start the simulator on our own address rather than every interface."""
+        loop = asyncio.get_running_loop()
+        self._con_lost.clear()
+        sock = socket(AF_INET, SOCK_DGRAM)
+        sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        sock.setsockopt(SOL_SOCKET, SO_BROADCAST, 1)
+        sock.bind((self.host, SPA_PORT))
+        self._transport, self._protocol = await loop.create_datagram_endpoint(
+            lambda: GeckoAsyncUdpProtocol(self, self._con_lost, None),
+            sock=sock,
+        )
+        await self._install_standard_handlers()
+        self._send_structure_change = True
+
+    async def do_name(self, _args: str) -> None:
+        """
+        Answer discovery with our own name and identifier.
+
+        The base class renames the spa from the snapshot and builds the hello
+        response from the module identifier, which every simulator shares.
+        """
+        self._name = self.spa_name
+        if self._hello_task is not None:
+            self._hello_task.cancel()
+            self._hello_task = None
+        if self._protocol is not None:
+            self._hello_task = self.add_task(
+                GeckoHelloProtocolHandler.response(
+                    self.identifier,
+                    self._name,
+                    async_on_handled=self._async_on_hello,
+                ).consume(self._protocol),
+                "Hello handler",
+                "SIM",
+            )
+
+    async def _async_on_packet(self, handler: Any, _sender: tuple) -> None:
+        # The base class warns about every packet not addressed to the module
+        # identifier
+        self._protocol.datagram_received(handler.packet_content, handler.parms)
+
+    def _on_accessor_changed(
+        self, accessor: Any, old_value: Any, new_value: Any
+    ) -> None:
+        # The same as the base class, without printing every change
+        self._accessor_change_queue.put_nowait((accessor, old_value, new_value))
+        if self._send_structure_change:
+            self._structure_change_queue.put_nowait(accessor.pos)
+
+    async def _async_on_set_value(self, pos: int, length: int, newvalue: Any) -> None:
+        """Apply a change to the status block and count it if it is reported."""
+        await super()._async_on_set_value(pos, length, newvalue)
+        if self._send_structure_change:
+            self.changes_sent += 1
+
+    async def _churn(self) -> None:
+        """Flip boolean registers at the configured rate."""
+        accessors = [
+            accessor
+            for accessor in self.structure.accessors.values()
+            if isinstance(accessor, GeckoBoolStructAccessor)
+        ]
+        if not accessors:
+            _LOGGER.warning("Snapshot has no boolean registers to churn")
+            return
+        interval = 1.0 / self.churn_rate
+        while True:
+            await asyncio.sleep(interval)
+            accessor = random.choice(accessors)  # noqa: S311
+            await accessor.async_set_value(not accessor.value)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    async with contextlib.AsyncExitStack() as stack:
+        for index in range(args.count):
+            spa = await stack.enter_async_context(
+                SimulatedSpa(
+                    args.snapshot,
+                    host=args.host if args.count == 1 else spa_host(index),
+                    name=args.name if args.count == 1 else f"{args.name} {index}",
+                    identifier=(
+                        simulator.SPA_IDENTIFIER
+                        if args.count == 1
+                        else spa_identifier(index)
+                    ),
+                    churn_rate=args.churn_rate,
+                )
+            )
+            sys.stdout.write(
+                f"Simulating '{spa.spa_name}' ({spa.identifier_as_string}) "
+                f"on {spa.host}:{SPA_PORT}, churn {spa.churn_rate}/s\n"
+            )
+            sys.stdout.flush()
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Run a simulated spa until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", required=True, help="Snapshot file to load")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind to")
+    parser.add_argument("--name", default="Simulated Spa", help="Spa name")
+    parser.add_argument(
+        "--churn-rate", type=float, default=0.0, help="Register changes per second"
+    )
+    parser.add_argument(
+        "--count", type=int, default=1, help="Number of spas to simulate"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    main()
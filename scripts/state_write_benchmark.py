@@ -0,0 +1,174 @@
+"""
+State write microbenchmark for the Gecko integration against a simulated spa.
+
+Once every entity of a simulated spa is ready, each one writes its state a
+number of times in a tight loop, a few rounds over, and the cost per write of
+its fastest round is reported for each entity class, as the slower rounds
+only add noise from the rest of the process. The spa is not churned, so every
+write after the first finds the state unchanged, which leaves the cost of the
+entity working out its state and attributes and Home Assistant comparing
+them.
+
+With --baseline, the integration as it is at that git revision is measured
+first, in a fresh interpreter since Python would otherwise reuse the modules
+already imported, and the median cost per write of each entity class is
+reported before and after.
+
+Usage
+
+    python scripts/state_write_benchmark.py --snapshot <file> [--writes 2000]
+        [--rounds 5] [--baseline <revision>] [--json results.json]
+
+Requires the packages in requirements.txt and the geckolib version from the
+manifest to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from bench_harness import (
+    REPO_ROOT,
+    async_add_spa,
+    async_home_assistant,
+    async_wait_ready,
+    spa_manager,
+)
+from spa_simulator import SimulatedSpa
+
+
+def _time_writes(entity: Any, writes: int, rounds: int) -> float:
+    """Get the microseconds per state write for an entity, in its best round."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(writes):
+            entity.async_write_ha_state()
+        best = min(best, time.perf_counter() - start)
+    return best / writes * 1_000_000
+
+
+async def _async_measure(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure the state writes of the integration in args.components."""
+    async with (
+        SimulatedSpa(args.snapshot, host=args.host, name=args.name),
+        async_home_assistant(components=args.components) as hass,
+    ):
+        entry = await async_add_spa(hass, args.host, args.name)
+        await async_wait_ready(hass, entry)
+        # Let the last of the setup writes go before measuring
+        await hass.async_block_till_done()
+
+        samples: dict[str, list[float]] = defaultdict(list)
+        for entity in spa_manager(hass, entry).entities:
+            # Disabled entities are never added, so can't write their state
+            if not entity.enabled:
+                continue
+            samples[type(entity).__name__].append(
+                _time_writes(entity, args.writes, args.rounds)
+            )
+
+    return {
+        name: {
+            "entities": len(costs),
+            "median_us": statistics.median(costs),
+            "max_us": max(costs),
+        }
+        for name, costs in sorted(samples.items())
+    }
+
+
+def _measure_baseline(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure the integration at the baseline revision in a fresh interpreter."""
+    archive = subprocess.run(  # noqa: S603
+        ["git", "archive", args.baseline, "custom_components"],  # noqa: S607
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tempfile.TemporaryDirectory() as tree:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tree, filter="data")
+        completed = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                __file__,
+                "--snapshot",
+                str(args.snapshot),
+                "--host",
+                args.host,
+                "--name",
+                args.name,
+                "--writes",
+                str(args.writes),
+                "--rounds",
+                str(args.rounds),
+                "--components",
+                str(Path(tree) / "custom_components"),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return json.loads(completed.stdout)
+
+
+def _compare(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Put the two runs side by side for the classes both of them have."""
+    return {
+        "before": before,
+        "after": after,
+        "median_speedup": {
+            name: before[name]["median_us"] / after[name]["median_us"]
+            for name in sorted(before.keys() & after.keys())
+        },
+    }
+
+
+def main() -> None:
+    """Run the state write benchmark and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", required=True, help="Snapshot file to load")
+    parser.add_argument("--host", default="127.0.0.1", help="Simulator address")
+    parser.add_argument("--name", default="Simulated Spa", help="Spa name")
+    parser.add_argument(
+        "--writes", type=int, default=2000, help="State writes per entity a round"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per entity")
+    parser.add_argument(
+        "--baseline", help="Git revision to measure first and compare against"
+    )
+    parser.add_argument(
+        "--components",
+        type=Path,
+        default=REPO_ROOT / "custom_components",
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    if args.baseline is None:
+        results = asyncio.run(_async_measure(args))
+    else:
+        before = _measure_baseline(args)
+        results = _compare(before, asyncio.run(_async_measure(args)))
+    report = json.dumps(results, indent=2)
+    sys.stdout.write(f"{report}\n")
+    if args.json is not None:
+        args.json.write_text(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Tests for the command pipeline and the entities that coalesce through it."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from geckolib import GeckoPump
+
+from custom_components.gecko.command_pipeline import GeckoCommandPipeline
+from custom_components.gecko.fan import GeckoFan
+
+
+def _blocked_until(release: asyncio.Event) -> AsyncMock:
+    """Build a command that stays in flight until the event is set."""
+
+    async def _command(*_args: Any, **_kwargs: Any) -> None:
+        await release.wait()
+
+    return AsyncMock(side_effect=_command)
+
+
+def _fan() -> GeckoFan:
+    """Build a two speed pump fan whose writes go straight to the pipeline."""
+    pump = MagicMock(spec=GeckoPump)
+    pump.unique_id = "SPA-P1"
+    pump.name = "Pump 1"
+    pump.parent_name = "Spa"
+    pump.pump_type = GeckoPump.PumpType.TWO_SPEED
+    fan = GeckoFan(MagicMock(), MagicMock(), pump)
+
+    async def _send(_values: Any, command: Any, *args: Any, **kwargs: Any) -> None:
+        await fan.commands.async_send(command, *args, **kwargs)
+
+    fan._async_send_optimistic = _send  # noqa: SLF001
+    return fan
+
+
+def test_same_command_coalesces_keywords() -> None:
+    """A pending call to the same command is replaced, keeping its keywords."""
+
+    async def _run() -> None:
+        pipeline = GeckoCommandPipeline("test")
+        release = asyncio.Event()
+        first = _blocked_until(release)
+        second = AsyncMock()
+        sends = [
+            asyncio.create_task(pipeline.async_send(first)),
+            asyncio.create_task(pipeline.async_send(second, colour="red")),
+            asyncio.create_task(pipeline.async_send(second, brightness=10)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*sends)
+
+        first.assert_awaited_once_with()
+        second.assert_awaited_once_with(colour="red", brightness=10)
+        assert pipeline.counters["writes_coalesced"] == 1
+
+    asyncio.run(_run())
+
+
+def test_fan_preset_survives_a_coalesced_speed_change() -> None:
+    """Turning on with a preset then changing speed still sends the preset."""
+
+    async def _run() -> None:
+        fan = _fan()
+        release = asyncio.Event()
+        fan.pump.async_turn_off = _blocked_until(release)
+        fan.pump.async_turn_on = AsyncMock()
+
+        calls = [
+            asyncio.create_task(fan.async_turn_off()),
+            asyncio.create_task(fan.async_turn_on(preset_mode="LO")),
+            asyncio.create_task(fan.async_set_percentage(50)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*calls)
+
+        fan.pump.async_turn_on.assert_awaited_once_with(percentage=50, preset_mode="LO")
+
+    asyncio.run(_run())
@@ -0,0 +1,14 @@
+"""Tests for the integration manifest."""
+
+import json
+from pathlib import Path
+
+from custom_components.gecko.const import GECKOLIB_LOCATE_VERSION
+
+MANIFEST = Path(__file__).parent.parent / "custom_components/gecko/manifest.json"
+
+
+def test_locate_override_matches_geckolib_requirement() -> None:
+    """The spa manager's locate override is written against the pinned geckolib."""
+    requirements = json.loads(MANIFEST.read_text())["requirements"]
+    assert f"geckolib=={GECKOLIB_LOCATE_VERSION}" in requirements
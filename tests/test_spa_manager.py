@@ -0,0 +1,64 @@
+"""Tests for how the spa manager gathers spa events."""
+
+import asyncio
+from types import SimpleNamespace
+
+from geckolib import GeckoSpaEvent
+
+from custom_components.gecko.const import EVENT_SETTLE_TIME
+from custom_components.gecko.spa_manager import GeckoSpaManager
+
+
+async def _collect(*events: GeckoSpaEvent, later: GeckoSpaEvent | None = None) -> tuple:
+    """Queue events, optionally add one more while settling, and collect."""
+    queue: asyncio.Queue[GeckoSpaEvent] = asyncio.Queue()
+    for event in events:
+        queue.put_nowait(event)
+    if later is not None:
+        asyncio.get_running_loop().call_later(
+            EVENT_SETTLE_TIME / 5, queue.put_nowait, later
+        )
+    manager = SimpleNamespace(_event_queue=queue)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    collected = await GeckoSpaManager._async_collect_events(manager)  # noqa: SLF001
+    return collected, loop.time() - started
+
+
+def test_ping_is_handed_on_at_once() -> None:
+    """An event that changes no entities doesn't wait for others."""
+    collected, elapsed = asyncio.run(_collect(GeckoSpaEvent.RUNNING_PING_RECEIVED))
+    assert collected == [GeckoSpaEvent.RUNNING_PING_RECEIVED]
+    assert elapsed < EVENT_SETTLE_TIME / 2
+
+
+def test_reload_events_settle_together() -> None:
+    """A reload event waits for the rest of its burst."""
+    collected, elapsed = asyncio.run(
+        _collect(
+            GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
+            later=GeckoSpaEvent.CLIENT_HAS_RECONNECT_BUTTON,
+        )
+    )
+    assert collected == [
+        GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
+        GeckoSpaEvent.CLIENT_HAS_RECONNECT_BUTTON,
+    ]
+    assert elapsed >= EVENT_SETTLE_TIME * 0.9
+
+
+def test_facade_ready_closes_the_window() -> None:
+    """The facade being ready takes what is queued and stops waiting."""
+    collected, elapsed = asyncio.run(
+        _collect(
+            GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
+            GeckoSpaEvent.CLIENT_FACADE_IS_READY,
+            GeckoSpaEvent.RUNNING_PING_RECEIVED,
+        )
+    )
+    assert collected == [
+        GeckoSpaEvent.CLIENT_HAS_STATUS_SENSOR,
+        GeckoSpaEvent.CLIENT_FACADE_IS_READY,
+        GeckoSpaEvent.RUNNING_PING_RECEIVED,
+    ]
+    assert elapsed < EVENT_SETTLE_TIME / 2